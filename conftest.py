@@ -0,0 +1,80 @@
+"""
+Shared pytest fixtures for Kid Cam Game PC
+"""
+
+import os
+import sys
+import time
+from unittest import mock
+import numpy as np
+import pytest
+
+# Headless runs (CI, or Linux without a display) use SDL's in-memory drivers
+# instead of failing to open a window or sound device
+_has_display = os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+if os.environ.get("CI") or (sys.platform.startswith("linux") and not _has_display):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+@pytest.fixture(scope="session")
+def pygame_screen():
+    """One pygame session and window shared by every test"""
+    import pygame
+    
+    pygame.init()
+    # Hidden, so test runs on a desktop don't pop up a window
+    screen = pygame.display.set_mode((1024, 768), pygame.HIDDEN)
+    yield screen
+    pygame.quit()
+
+@pytest.fixture(scope="session")
+def main_menu(pygame_screen):
+    """One MainMenu, with its fonts loaded and buttons rendered, shared by every test"""
+    from src.ui.main_menu import MainMenu
+    
+    return MainMenu(pygame_screen)
+
+def pytest_addoption(parser):
+    """Add the opt-in flag for interactive tests"""
+    parser.addoption("--run-visual", action="store_true", default=False,
+                     help="run visual tests that open a window and wait for input")
+
+def pytest_collection_modifyitems(config, items):
+    """Skip visual tests unless asked for - they need someone at the keyboard"""
+    if config.getoption("--run-visual"):
+        return
+    
+    skip_visual = pytest.mark.skip(reason="visual test - run it with --run-visual")
+    for item in items:
+        if "visual" in item.keywords:
+            item.add_marker(skip_visual)
+
+class FakeCapture:
+    """Stands in for cv2.VideoCapture, delivering blank frames at camera pace"""
+    
+    def __init__(self, *args, **kwargs):
+        self.frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    
+    def isOpened(self):
+        return True
+    
+    def read(self):
+        time.sleep(1 / 30)
+        return True, self.frame.copy()
+    
+    def set(self, prop, value):
+        return True
+    
+    def release(self):
+        pass
+
+@pytest.fixture(scope="session")
+def fake_camera():
+    """One CameraManager, initialized against a fake device, shared by every test"""
+    from src.utils.camera import CameraManager
+    
+    camera = CameraManager()
+    with mock.patch("cv2.VideoCapture", FakeCapture):
+        assert camera.initialize()
+    yield camera
+    camera.cleanup()
@@ -8,6 +8,8 @@ import subprocess
 import sys
 import os
 import platform
+import re
+from src.utils.camera_cache import preferred_backend, save_camera_index
 
 def print_header():
     """Print welcome header"""
@@ -51,39 +53,104 @@ def install_dependencies():
         return False
     
     try:
-        # Install requirements
+        # Install requirements in one pip run, streaming its progress to the console.
+        # Bytecode compilation is deferred so it can run on all cores afterwards.
         result = subprocess.run([
-            sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-        ], capture_output=True, text=True)
+            sys.executable, "-m", "pip", "install",
+            "--disable-pip-version-check", "--no-input", "--no-compile", "--progress-bar", "on",
+            "-r", "requirements.txt"
+        ])
         
         if result.returncode == 0:
+            compile_dependencies()
             print("✅ Dependencies installed successfully!")
             return True
         else:
-            print("❌ Failed to install dependencies:")
-            print(result.stderr)
+            print("❌ Failed to install dependencies (see pip output above)")
             return False
             
     except Exception as e:
         print(f"❌ Error installing dependencies: {e}")
         return False
 
+def compile_dependencies():
+    """Pre-compile installed packages in parallel for a faster first start"""
+    print("\n⚙️ Compiling installed packages...")
+    
+    try:
+        paths = installed_package_paths("requirements.txt")
+    except ImportError:
+        print("⚠️ Skipping pre-compilation (needs Python 3.8 or newer)")
+        return False
+    
+    if not paths:
+        print("⚠️ No installed packages found to compile")
+        return False
+    
+    result = subprocess.run([sys.executable, "-m", "compileall", "-q", "-j", "0"] + paths)
+    if result.returncode != 0:
+        print("⚠️ Some packages could not be pre-compiled (see output above)")
+        print("   The game will still run, but its first start may be slower.")
+        return False
+    
+    print("✅ Packages compiled!")
+    return True
+
+def installed_package_paths(requirements_file):
+    """Top-level package directories of the requirements and everything they depend on"""
+    from importlib import metadata
+    
+    with open(requirements_file) as f:
+        pending = [line.split("#")[0].strip() for line in f]
+    pending = [line for line in pending if line and not line.startswith("-")]
+    
+    seen = set()
+    paths = set()
+    while pending:
+        name = re.match(r"[A-Za-z0-9._-]+", pending.pop()).group(0)
+        key = re.sub(r"[-_.]+", "-", name).lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        
+        try:
+            dist = metadata.distribution(name)
+        except metadata.PackageNotFoundError:
+            continue
+        
+        # Only the first path component is kept, so each package is compiled
+        # as one directory instead of file by file
+        for file in dist.files or []:
+            if file.suffix == ".py" and file.parts[0] != "..":
+                paths.add(str(dist.locate_file(file.parts[0])))
+        
+        # Optional extras were not installed, so their dependencies are skipped
+        pending.extend(req for req in dist.requires or [] if "extra ==" not in req)
+    
+    return sorted(paths)
+
 def check_camera():
     """Check if camera is available"""
     print("\n📷 Checking camera availability...")
     
     try:
         import cv2
-        cap = cv2.VideoCapture(0)
+        backend = preferred_backend()
         
-        if cap.isOpened():
-            print("✅ Camera detected and accessible!")
+        # Probe the first few devices and remember the one that works
+        for index in range(4):
+            cap = cv2.VideoCapture(index, backend)
+            opened = cap.isOpened()
             cap.release()
-            return True
-        else:
-            print("⚠️ Camera not detected or not accessible.")
-            print("   The game will still run, but camera features won't work.")
-            return False
+            
+            if opened:
+                save_camera_index(index)
+                print(f"✅ Camera {index} detected and accessible!")
+                return True
+        
+        print("⚠️ Camera not detected or not accessible.")
+        print("   The game will still run, but camera features won't work.")
+        return False
             
     except ImportError:
         print("⚠️ OpenCV not available for camera test.")
@@ -101,14 +168,15 @@ def run_test():
         return True
     
     try:
-        result = subprocess.run([sys.executable, "test_game.py"], 
-                              capture_output=True, text=True)
-        
-        print(result.stdout)
-        if result.stderr:
-            print("Errors:")
-            print(result.stderr)
-        
+        import pytest
+    except ImportError:
+        print("⚠️ pytest not installed, skipping tests.")
+        print("   Install it with: pip install -r requirements-dev.txt")
+        return True
+    
+    try:
+        # Output goes straight to the console, so results show up as the tests run
+        result = subprocess.run([sys.executable, "-m", "pytest", "test_game.py"])
         return result.returncode == 0
         
     except Exception as e:
@@ -155,8 +223,8 @@ def print_instructions():
     print("To start the game:")
     print("  python main.py")
     print()
-    print("Or run the test first:")
-    print("  python test_game.py")
+    print("Or run the tests first:")
+    print("  python -m pytest")
     print()
     print("Game Controls:")
     print("  • ESC - Exit games or quit")
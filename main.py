@@ -21,7 +21,12 @@ FPS = 30
 
 class KidCamGame:
     def __init__(self):
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        try:
+            # Hardware-accelerated, vsynced presentation where the driver supports it
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT),
+                                                  pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Kid Cam Game PC 🎮📷")
         self.clock = pygame.time.Clock()
         self.running = True
@@ -33,10 +38,13 @@ class KidCamGame:
         
         # Game state
         self.current_state = "menu"  # menu, playing, paused
+        self.dirty = True  # Whether the screen needs redrawing this frame
         
     def handle_events(self):
         """Handle pygame events"""
         for event in pygame.event.get():
+            self.dirty = True
+            
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -59,9 +67,13 @@ class KidCamGame:
     def update(self):
         """Update game state"""
         if self.current_state == "playing":
-            self.game_manager.update()
+            # Nothing moves while paused or between camera frames
+            if self.game_manager.update():
+                self.dirty = True
         elif self.current_state == "menu":
+            # Menu clouds drift every frame
             self.main_menu.update()
+            self.dirty = True
     
     def draw(self):
         """Draw everything to screen"""
@@ -89,7 +101,11 @@ class KidCamGame:
         while self.running:
             self.handle_events()
             self.update()
-            self.draw()
+            
+            if self.dirty:
+                self.draw()
+                self.dirty = False
+            
             self.clock.tick(FPS)
         
         # Cleanup
@@ -6,34 +6,40 @@ import pygame
 from src.games.face_fun import FaceFunGame
 from src.games.color_hunt import ColorHuntGame
 from src.games.motion_magic import MotionMagicGame
+from src.ui.fonts import get_font
 
 class GameManager:
     def __init__(self, screen, camera_manager):
         self.screen = screen
         self.camera_manager = camera_manager
+        self.width = screen.get_width()
+        self.height = screen.get_height()
         self.current_game = None
         self.game_name = None
         self.paused = False
         
-        # Initialize games
+        # Game classes - each is created on first start, then reused
         self.games = {
-            'face_fun': FaceFunGame(screen, camera_manager),
-            'color_hunt': ColorHuntGame(screen, camera_manager),
-            'motion_magic': MotionMagicGame(screen, camera_manager)
+            'face_fun': FaceFunGame,
+            'color_hunt': ColorHuntGame,
+            'motion_magic': MotionMagicGame
         }
+        self._game_instances = {}
         
         # Fonts for pause screen
-        try:
-            self.pause_font = pygame.font.Font(None, 72)
-            self.instruction_font = pygame.font.Font(None, 36)
-        except:
-            self.pause_font = pygame.font.Font(None, 72)
-            self.instruction_font = pygame.font.Font(None, 36)
+        self.pause_font = get_font(72)
+        self.instruction_font = get_font(36)
+        
+        # Pause screen never changes, so it is composited once up front
+        self._pause_overlay = self._build_pause_overlay()
     
     def start_game(self, game_name):
         """Start a specific game mode"""
         if game_name in self.games:
-            self.current_game = self.games[game_name]
+            if game_name not in self._game_instances:
+                self._game_instances[game_name] = self.games[game_name](self.screen,
+                                                                        self.camera_manager)
+            self.current_game = self._game_instances[game_name]
             self.game_name = game_name
             self.paused = False
             self.current_game.start()
@@ -58,11 +64,13 @@ class GameManager:
                 print("▶️ Game resumed")
     
     def update(self):
-        """Update current game"""
+        """Update current game, returning True if it advanced"""
         if self.current_game and not self.paused:
-            # Capture new frame
-            if self.camera_manager.capture_frame():
+            # Only advance the game when the camera delivered a new frame
+            if self.camera_manager.poll_latest() is not None:
                 self.current_game.update()
+                return True
+        return False
     
     def draw(self):
         """Draw current game"""
@@ -75,17 +83,18 @@ class GameManager:
     
     def _draw_pause_overlay(self):
         """Draw pause screen overlay"""
+        self.screen.blit(self._pause_overlay, (0, 0))
+    
+    def _build_pause_overlay(self):
+        """Render the pause overlay and its text onto a single surface"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA).convert_alpha()
+        overlay.fill((0, 0, 0, 128))
         
         # Pause text
         pause_text = self.pause_font.render("PAUSED", True, (255, 255, 255))
-        pause_rect = pause_text.get_rect(center=(self.screen.get_width()//2, 
-                                                self.screen.get_height()//2 - 50))
-        self.screen.blit(pause_text, pause_rect)
+        pause_rect = pause_text.get_rect(center=(self.width//2, self.height//2 - 50))
+        overlay.blit(pause_text, pause_rect)
         
         # Instructions
         instructions = [
@@ -96,7 +105,8 @@ class GameManager:
         y_offset = 50
         for instruction in instructions:
             text = self.instruction_font.render(instruction, True, (255, 255, 255))
-            text_rect = text.get_rect(center=(self.screen.get_width()//2, 
-                                            self.screen.get_height()//2 + y_offset))
-            self.screen.blit(text, text_rect)
+            text_rect = text.get_rect(center=(self.width//2, self.height//2 + y_offset))
+            overlay.blit(text, text_rect)
             y_offset += 40
+        
+        return overlay
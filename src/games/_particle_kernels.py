@@ -0,0 +1,58 @@
+"""
+Particle Kernels - Numba-compiled update loops for particles and falling stars
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    # Numba is optional - callers fall back to plain NumPy updates
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def integrate_particles(x, y, vx, vy, life, n, gravity):
+        """Advance particles in a single fused pass"""
+        for i in range(n):
+            x[i] += vx[i]
+            y[i] += vy[i]
+            vy[i] += gravity
+            life[i] -= 1
+    
+    @njit(cache=True, boundscheck=False)
+    def compact_particles(x, y, vx, vy, life, max_life, size, color, n):
+        """Move live particles to the front in order, returning how many survived"""
+        j = 0
+        for i in range(n):
+            if life[i] > 0:
+                if i != j:
+                    x[j] = x[i]
+                    y[j] = y[i]
+                    vx[j] = vx[i]
+                    vy[j] = vy[i]
+                    life[j] = life[i]
+                    max_life[j] = max_life[i]
+                    size[j] = size[i]
+                    color[j, 0] = color[i, 0]
+                    color[j, 1] = color[i, 1]
+                    color[j, 2] = color[i, 2]
+                j += 1
+        return j
+    
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def step_stars(x, y, vx, vy, rotation, size, wand_x, wand_y, wand_size, caught):
+        """Move falling stars and flag the ones touching a wand"""
+        for i in range(x.shape[0]):
+            x[i] += vx[i]
+            y[i] += vy[i]
+            rotation[i] += 0.1
+            
+            hit = False
+            for j in range(wand_x.shape[0]):
+                dx = x[i] - wand_x[j]
+                dy = y[i] - wand_y[j]
+                reach = size[i] + wand_size[j]
+                if dx * dx + dy * dy < reach * reach:
+                    hit = True
+                    break
+            caught[i] = hit
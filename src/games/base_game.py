@@ -2,8 +2,120 @@
 Base Game Class - Common functionality for all games
 """
 
+import functools
 import pygame
 import numpy as np
+from src.ui.fonts import get_font
+from src.games import _particle_kernels as kernels
+
+# Particle fade-out is quantized so faded sprites can be cached
+PARTICLE_ALPHA_BUCKETS = 8
+
+# Burst directions are picked from a fixed table of unit vectors
+_burst_angles = np.linspace(0, 2 * np.pi, 64, endpoint=False)
+BURST_DIRECTIONS = np.stack([np.cos(_burst_angles), np.sin(_burst_angles)], axis=1).astype(np.float32)
+
+# Uniform random numbers generated per refill of a game's random pool
+RANDOM_POOL_SIZE = 8192
+
+# Rendered text is reused until this many distinct strings have been seen
+TEXT_CACHE_SIZE = 256
+
+@functools.lru_cache(maxsize=128)
+def _render_text_with_shadow(text, font, color, shadow_color, shadow_offset):
+    """Render text over its drop shadow into a single surface"""
+    shadow_surface = font.render(text, True, shadow_color)
+    text_surface = font.render(text, True, color)
+    
+    dx, dy = shadow_offset
+    surface = pygame.Surface((text_surface.get_width() + abs(dx),
+                              text_surface.get_height() + abs(dy)), pygame.SRCALPHA)
+    surface.blit(shadow_surface, (max(dx, 0), max(dy, 0)))
+    surface.blit(text_surface, (max(-dx, 0), max(-dy, 0)))
+    return surface.convert_alpha()
+
+class ParticleSystem:
+    """Particle storage kept as parallel NumPy arrays (structure-of-arrays)"""
+    
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.count = 0
+        
+        # Preallocated buffers - live particles occupy the first `count` slots
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+    
+    def __len__(self):
+        return self.count
+    
+    def _arrays(self):
+        return (self.x, self.y, self.vx, self.vy, self.life, self.max_life,
+                self.size, self.color)
+    
+    def add(self, x, y, vx, vy, color, size=3, life=60):
+        """Add a single particle (dropped when the buffer is full)"""
+        if self.count >= self.capacity:
+            return
+        
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.color[i] = color[:3]
+        self.size[i] = size
+        self.life[i] = life
+        self.max_life[i] = life
+        self.count += 1
+    
+    def add_many(self, x, y, vx, vy, color, size=3, life=60):
+        """Add a batch of particles - scalar arguments are shared by the whole batch"""
+        total = np.broadcast(x, y, vx, vy, size).size
+        start = self.count
+        count = min(total, self.capacity - start)
+        if count <= 0:
+            return
+        
+        end = start + count
+        self.x[start:end] = np.broadcast_to(x, (total,))[:count]
+        self.y[start:end] = np.broadcast_to(y, (total,))[:count]
+        self.vx[start:end] = np.broadcast_to(vx, (total,))[:count]
+        self.vy[start:end] = np.broadcast_to(vy, (total,))[:count]
+        self.color[start:end] = np.broadcast_to(np.asarray(color)[..., :3], (total, 3))[:count]
+        self.size[start:end] = np.broadcast_to(size, (total,))[:count]
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.count = end
+    
+    def update(self, gravity=0.2):
+        """Move all particles, apply gravity and drop dead ones"""
+        n = self.count
+        if n == 0:
+            return
+        
+        if kernels.HAS_NUMBA:
+            kernels.integrate_particles(self.x, self.y, self.vx, self.vy, self.life, n, np.float32(gravity))
+            self.count = kernels.compact_particles(*self._arrays(), n)
+            return
+        
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += gravity
+        self.life[:n] -= 1
+        
+        # Compact survivors to the front instead of removing one by one
+        alive = self.life[:n] > 0
+        survivors = int(np.count_nonzero(alive))
+        if survivors < n:
+            for array in self._arrays():
+                array[:survivors] = array[:n][alive]
+        self.count = survivors
 
 class BaseGame:
     def __init__(self, screen, camera_manager):
@@ -13,6 +125,10 @@ class BaseGame:
         self.height = screen.get_height()
         self.running = False
         
+        # Ticks at the start of the frame being drawn - animations read this
+        # instead of asking pygame for the time at every use
+        self._now = 0
+        
         # Common colors
         self.colors = {
             'white': (255, 255, 255),
@@ -27,18 +143,37 @@ class BaseGame:
         }
         
         # Common fonts
-        try:
-            self.title_font = pygame.font.Font(None, 48)
-            self.text_font = pygame.font.Font(None, 36)
-            self.small_font = pygame.font.Font(None, 24)
-        except:
-            self.title_font = pygame.font.Font(None, 48)
-            self.text_font = pygame.font.Font(None, 36)
-            self.small_font = pygame.font.Font(None, 24)
+        self.title_font = get_font(48)
+        self.text_font = get_font(36)
+        self.small_font = get_font(24)
         
         # Camera display area
         self.camera_rect = pygame.Rect(50, 50, 320, 240)
         
+        # Instructions shown by draw_ui never change, so render them once
+        instructions = [
+            "Press ESC to return to menu",
+            "Press SPACE to pause"
+        ]
+        self._ui_instructions = [
+            (self.small_font.render(instruction, True, self.colors['black']).convert_alpha(),
+             (10, self.height - 60 + i * 25))
+            for i, instruction in enumerate(instructions)
+        ]
+        
+        # Rendered text surfaces keyed by (font, text, color)
+        self._text_cache = {}
+        
+        # Particle effects shared by all games
+        self.particles = ParticleSystem()
+        self._particle_lut = {}  # packed (size, color, alpha bucket) -> sprite
+        self._circle_sprites = {}  # (radius, RGBA color) -> sprite
+        self._rng = np.random.default_rng()
+        
+        # Small per-frame random draws are served from one pre-filled block
+        self._random_pool = self._rng.random(RANDOM_POOL_SIZE)
+        self._random_pos = 0
+        
     def start(self):
         """Start the game"""
         self.running = True
@@ -63,83 +198,131 @@ class BaseGame:
     
     def draw_camera_feed(self):
         """Draw the camera feed in a designated area"""
-        frame = self.camera_manager.get_frame_for_display()
-        if frame is not None:
-            # Convert numpy array to pygame surface
-            frame_surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-            
-            # Scale to fit camera rect
-            scaled_frame = pygame.transform.scale(frame_surface, 
-                                                (self.camera_rect.width, self.camera_rect.height))
-            
+        frame_surface = self.camera_manager.get_display_surface(self.camera_rect.size)
+        if frame_surface is not None:
             # Draw frame with border
             pygame.draw.rect(self.screen, self.colors['white'], 
                            self.camera_rect.inflate(10, 10))
             pygame.draw.rect(self.screen, self.colors['black'], 
                            self.camera_rect.inflate(10, 10), 3)
             
-            self.screen.blit(scaled_frame, self.camera_rect)
+            self.screen.blit(frame_surface, self.camera_rect)
     
     def draw_ui(self):
         """Draw common UI elements"""
-        # Instructions
-        instructions = [
-            "Press ESC to return to menu",
-            "Press SPACE to pause"
-        ]
-        
-        y_pos = self.height - 60
-        for instruction in instructions:
-            text = self.small_font.render(instruction, True, self.colors['black'])
-            self.screen.blit(text, (10, y_pos))
-            y_pos += 25
+        self.screen.blits(self._ui_instructions, doreturn=False)
+    
+    def render_text(self, font, text, color):
+        """Render text once and reuse the surface on later frames"""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Changing labels such as scores would otherwise grow the cache forever
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
     
     def draw_text_with_shadow(self, text, font, color, shadow_color, pos, shadow_offset=(2, 2)):
         """Draw text with shadow effect"""
-        shadow_surface = font.render(text, True, shadow_color)
-        text_surface = font.render(text, True, color)
+        surface = _render_text_with_shadow(text, font, tuple(color), tuple(shadow_color),
+                                           tuple(shadow_offset))
         
-        shadow_pos = (pos[0] + shadow_offset[0], pos[1] + shadow_offset[1])
-        
-        self.screen.blit(shadow_surface, shadow_pos)
-        self.screen.blit(text_surface, pos)
+        # The composite is offset when the shadow falls above or left of the text
+        self.screen.blit(surface, (pos[0] - max(-shadow_offset[0], 0),
+                                   pos[1] - max(-shadow_offset[1], 0)))
     
     def draw_particle_effect(self, particles):
         """Draw particle effects"""
-        for particle in particles:
-            if particle['life'] > 0:
-                alpha = int(255 * (particle['life'] / particle['max_life']))
-                color = (*particle['color'][:3], alpha)
-                
-                # Create surface with alpha
-                particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), 
-                                                pygame.SRCALPHA)
-                pygame.draw.circle(particle_surface, color, 
-                                 (particle['size'], particle['size']), particle['size'])
-                
-                self.screen.blit(particle_surface, 
-                               (particle['x'] - particle['size'], particle['y'] - particle['size']))
+        n = particles.count
+        x = particles.x[:n]
+        y = particles.y[:n]
+        size = particles.size[:n]
+        
+        # Only particles overlapping the screen are worth a blit
+        visible = np.flatnonzero((x + size >= 0) & (x - size < self.width) &
+                                 (y + size >= 0) & (y - size < self.height))
+        
+        sizes = size[visible].astype(np.int64)
+        colors = particles.color[visible].astype(np.int64)
+        buckets = np.minimum(particles.life[visible] * PARTICLE_ALPHA_BUCKETS // particles.max_life[visible],
+                             PARTICLE_ALPHA_BUCKETS - 1).astype(np.int64)
+        
+        # Pack size, colour and alpha bucket into one integer sprite key per particle
+        keys = (sizes << 32) | (colors[:, 0] << 24) | (colors[:, 1] << 16) | (colors[:, 2] << 8) | buckets
+        lefts = x[visible] - sizes
+        tops = y[visible] - sizes
+        
+        # Submit every particle in one blits() call. Splatting into a full-screen
+        # NumPy layer instead costs more just to turn that layer into a Surface
+        # than blitting a few thousand cached sprites does.
+        lut = self._particle_lut
+        sprite = self._particle_sprite
+        self.screen.blits([
+            (lut[key] if key in lut else sprite(key), (left, top))
+            for key, left, top in zip(keys.tolist(), lefts.tolist(), tops.tolist())
+        ], doreturn=False)
+    
+    def _particle_sprite(self, key):
+        """Render and cache the circle sprite for a packed particle key"""
+        size = key >> 32
+        color = ((key >> 24) & 0xFF, (key >> 16) & 0xFF, (key >> 8) & 0xFF)
+        alpha = ((key & 0xFF) + 1) * 255 // PARTICLE_ALPHA_BUCKETS
+        
+        sprite = self.circle_sprite(size, (*color, alpha))
+        self._particle_lut[key] = sprite
+        return sprite
+    
+    def circle_sprite(self, radius, color):
+        """Get a cached (translucent) circle sprite - blit it at center minus radius"""
+        key = (radius, color)
+        sprite = self._circle_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            sprite = sprite.convert_alpha()
+            self._circle_sprites[key] = sprite
+        return sprite
+    
+    def random_floats(self, count):
+        """Take count uniform floats in [0, 1) from the game's random pool - only valid until the next call"""
+        if count > RANDOM_POOL_SIZE:
+            # Too many for the pool, so draw a fresh array
+            return self._rng.random(count)
+        
+        if self._random_pos + count > RANDOM_POOL_SIZE:
+            self._rng.random(out=self._random_pool)
+            self._random_pos = 0
+        
+        start = self._random_pos
+        self._random_pos += count
+        return self._random_pool[start:start + count]
+    
+    def random_ints(self, low, high, count):
+        """Take count integers in [low, high) from the game's random pool"""
+        return low + (self.random_floats(count) * (high - low)).astype(np.int64)
+    
+    def burst_velocities(self, count, min_speed, max_speed):
+        """Random outward (vx, vy) arrays for a burst of count particles"""
+        directions = BURST_DIRECTIONS[self.random_ints(0, len(BURST_DIRECTIONS), count)]
+        speeds = min_speed + self.random_floats(count) * (max_speed - min_speed)
+        return directions[:, 0] * speeds, directions[:, 1] * speeds
     
     def update_particles(self, particles):
         """Update particle system"""
-        for particle in particles[:]:  # Copy list to avoid modification during iteration
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.2  # Gravity
-            particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                particles.remove(particle)
-    
-    def create_particle(self, x, y, color, size=3, velocity=(0, -2)):
-        """Create a single particle"""
-        return {
-            'x': x,
-            'y': y,
-            'vx': velocity[0] + (np.random.random() - 0.5) * 4,
-            'vy': velocity[1] + (np.random.random() - 0.5) * 2,
-            'color': color,
-            'size': size,
-            'life': 60,
-            'max_life': 60
-        }
+        # Gravity keeps anything falling below the screen out of sight, so expire it now
+        n = particles.count
+        fallen = (particles.y[:n] - particles.size[:n] > self.height) & (particles.vy[:n] > 0)
+        particles.life[:n][fallen] = 0
+        particles.update()
+    
+    def create_particles_burst(self, x, y, color, count, size=3, velocity=(0, -2)):
+        """Add count particles at once - positions, colors and sizes may be per-particle arrays"""
+        spread = self.random_floats(count * 2).reshape(count, 2)
+        self.particles.add_many(
+            x, y,
+            velocity[0] + (spread[:, 0] - 0.5) * 4,
+            velocity[1] + (spread[:, 1] - 0.5) * 2,
+            color, size
+        )
@@ -5,26 +5,28 @@ Color Hunt Game - Interactive color detection game for kids
 import pygame
 import random
 import math
+import numpy as np
 from src.games.base_game import BaseGame
 
 class ColorHuntGame(BaseGame):
     def __init__(self, screen, camera_manager):
         super().__init__(screen, camera_manager)
-        self.target_color = None
-        self.detected_color = None
+        self.target_idx = 0
+        self.detected_idx = -1  # -1 when no known color is in view
         self.score = 0
-        self.particles = []
         self.success_timer = 0
         self.color_change_timer = 0
         
-        # Color definitions with fun names
-        self.color_targets = {
-            'red': {'name': '🔴 Red Fire', 'color': self.colors['red'], 'effect': 'fire'},
-            'blue': {'name': '🔵 Blue Ocean', 'color': self.colors['blue'], 'effect': 'water'},
-            'green': {'name': '🟢 Green Nature', 'color': self.colors['green'], 'effect': 'leaves'},
-            'yellow': {'name': '🟡 Yellow Sun', 'color': self.colors['yellow'], 'effect': 'sparkle'},
-            'purple': {'name': '🟣 Purple Magic', 'color': self.colors['purple'], 'effect': 'magic'}
-        }
+        # Color definitions with fun names, all indexed by color index
+        self.color_keys = ('red', 'blue', 'green', 'yellow', 'purple')
+        self.color_names = ('🔴 Red Fire', '🔵 Blue Ocean', '🟢 Green Nature',
+                            '🟡 Yellow Sun', '🟣 Purple Magic')
+        self.color_effects = ('fire', 'water', 'leaves', 'sparkle', 'magic')
+        self.color_values = tuple(self.colors[key] for key in self.color_keys)
+        self._color_index = {key: i for i, key in enumerate(self.color_keys)}
+        
+        # Pre-rendered gradient backgrounds, one per target color
+        self._bg_cache = {}
         
         # Start with first color
         self._set_new_target_color()
@@ -35,10 +37,10 @@ class ColorHuntGame(BaseGame):
         
     def _set_new_target_color(self):
         """Set a new target color to find"""
-        self.target_color = random.choice(list(self.color_targets.keys()))
+        self.target_idx = random.randrange(len(self.color_keys))
         self.consecutive_detections = 0
         self.color_change_timer = 0
-        print(f"🎯 New target: {self.color_targets[self.target_color]['name']}")
+        print(f"🎯 New target: {self.color_names[self.target_idx]}")
     
     def update(self):
         """Update color hunt game"""
@@ -46,10 +48,11 @@ class ColorHuntGame(BaseGame):
             return
         
         # Detect dominant color in camera
-        self.detected_color = self.camera_manager.detect_dominant_color()
+        detected_color = self.camera_manager.detect_dominant_color()
+        self.detected_idx = self._color_index.get(detected_color, -1)
         
         # Check if detected color matches target
-        if self.detected_color == self.target_color:
+        if self.detected_idx == self.target_idx:
             self.consecutive_detections += 1
             
             # Success if detected for enough frames
@@ -67,7 +70,7 @@ class ColorHuntGame(BaseGame):
         self.update_particles(self.particles)
         
         # Create ambient particles based on detected color
-        if self.detected_color and random.random() < 0.3:
+        if self.detected_idx >= 0 and random.random() < 0.3:
             self._create_color_particles()
         
         # Update success timer
@@ -76,6 +79,9 @@ class ColorHuntGame(BaseGame):
     
     def draw(self):
         """Draw color hunt game"""
+        # One timestamp shared by every animation this frame
+        self._now = pygame.time.get_ticks()
+        
         # Background based on target color
         self._draw_themed_background()
         
@@ -96,18 +102,21 @@ class ColorHuntGame(BaseGame):
     
     def _draw_themed_background(self):
         """Draw background themed to target color"""
-        target_info = self.color_targets[self.target_color]
-        base_color = target_info['color']
-        
-        # Create gradient background
-        for y in range(self.height):
-            ratio = y / self.height
-            # Fade from light version of color to darker
-            r = int(base_color[0] * (0.3 + 0.4 * (1 - ratio)))
-            g = int(base_color[1] * (0.3 + 0.4 * (1 - ratio)))
-            b = int(base_color[2] * (0.3 + 0.4 * (1 - ratio)))
-            
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.width, y))
+        background = self._bg_cache.get(self.target_idx)
+        if background is None:
+            background = self._build_gradient(self.color_values[self.target_idx])
+            self._bg_cache[self.target_idx] = background
+        
+        self.screen.blit(background, (0, 0))
+    
+    def _build_gradient(self, base_color):
+        """Render a vertical gradient from a light to a darker shade of a color"""
+        ratios = np.arange(self.height) / self.height
+        rows = (np.array(base_color) * (0.3 + 0.4 * (1 - ratios))[:, None]).astype(np.uint8)
+        
+        # Surfaces are indexed (x, y), so repeat the row colors across the width
+        pixels = np.ascontiguousarray(np.broadcast_to(rows[None, :, :], (self.width, self.height, 3)))
+        return pygame.surfarray.make_surface(pixels).convert()
     
     def _draw_detection_area(self):
         """Draw the color detection area overlay"""
@@ -120,11 +129,11 @@ class ColorHuntGame(BaseGame):
         
         # Draw detection area border
         border_color = self.colors['white']
-        if self.detected_color == self.target_color:
+        if self.detected_idx == self.target_idx:
             # Green border when correct color detected
             border_color = self.colors['green']
             # Pulsing effect
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.02)) * 5
+            pulse = abs(math.sin(self._now * 0.02)) * 5
             detection_rect.inflate_ip(pulse, pulse)
         
         pygame.draw.rect(self.screen, border_color, detection_rect, 3)
@@ -143,19 +152,17 @@ class ColorHuntGame(BaseGame):
             pygame.draw.rect(self.screen, self.colors['white'], progress_border, 2)
         
         # Show detected color
-        if self.detected_color:
-            color_info = self.color_targets.get(self.detected_color)
-            if color_info:
-                detected_text = f"Found: {color_info['name']}"
-                text_surface = self.small_font.render(detected_text, True, self.colors['white'])
-                text_rect = text_surface.get_rect(center=(detection_rect.centerx, 
-                                                        detection_rect.bottom + 25))
-                
-                # Text background
-                bg_rect = text_rect.inflate(10, 5)
-                pygame.draw.rect(self.screen, self.colors['black'], bg_rect, border_radius=5)
-                
-                self.screen.blit(text_surface, text_rect)
+        if self.detected_idx >= 0:
+            detected_text = f"Found: {self.color_names[self.detected_idx]}"
+            text_surface = self.render_text(self.small_font, detected_text, self.colors['white'])
+            text_rect = text_surface.get_rect(center=(detection_rect.centerx, 
+                                                    detection_rect.bottom + 25))
+            
+            # Text background
+            bg_rect = text_rect.inflate(10, 5)
+            pygame.draw.rect(self.screen, self.colors['black'], bg_rect, border_radius=5)
+            
+            self.screen.blit(text_surface, text_rect)
     
     def _draw_game_ui(self):
         """Draw game-specific UI"""
@@ -166,24 +173,24 @@ class ColorHuntGame(BaseGame):
         
         # Score
         score_text = f"Colors Found: {self.score} 🎨"
-        score_surface = self.text_font.render(score_text, True, self.colors['white'])
+        score_surface = self.render_text(self.text_font, score_text, self.colors['white'])
         self.screen.blit(score_surface, (self.width - 250, 10))
         
         # Target color display
-        target_info = self.color_targets[self.target_color]
-        target_text = f"Find: {target_info['name']}"
+        target_name = self.color_names[self.target_idx]
+        target_text = f"Find: {target_name}"
         
         # Large target color display
         target_rect = pygame.Rect(self.width - 300, 100, 200, 80)
-        pygame.draw.rect(self.screen, target_info['color'], target_rect, border_radius=10)
+        pygame.draw.rect(self.screen, self.color_values[self.target_idx], target_rect, border_radius=10)
         pygame.draw.rect(self.screen, self.colors['white'], target_rect, 3, border_radius=10)
         
         # Target text
-        text_surface = self.text_font.render(target_text, True, self.colors['white'])
+        text_surface = self.render_text(self.text_font, target_text, self.colors['white'])
         text_rect = text_surface.get_rect(center=target_rect.center)
         
         # Text shadow for visibility
-        shadow_surface = self.text_font.render(target_text, True, self.colors['black'])
+        shadow_surface = self.render_text(self.text_font, target_text, self.colors['black'])
         shadow_rect = text_rect.move(2, 2)
         
         self.screen.blit(shadow_surface, shadow_rect)
@@ -196,26 +203,30 @@ class ColorHuntGame(BaseGame):
             "⏱️ Colors change automatically"
         ]
         
+        screen = self.screen
+        font = self.small_font
+        white = self.colors['white']
+        center_x = self.width // 2
         instruction_y = self.height - 200
         for instruction in instructions:
-            text_surface = self.small_font.render(instruction, True, self.colors['white'])
-            text_rect = text_surface.get_rect(center=(self.width//2, instruction_y))
+            text_surface = self.render_text(font, instruction, white)
+            text_rect = text_surface.get_rect(center=(center_x, instruction_y))
             
             # Background for readability
             bg_rect = text_rect.inflate(10, 5)
-            pygame.draw.rect(self.screen, (0, 0, 0, 128), bg_rect, border_radius=5)
+            pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect, border_radius=5)
             
-            self.screen.blit(text_surface, text_rect)
+            screen.blit(text_surface, text_rect)
             instruction_y += 25
         
         # Success message
         if self.success_timer > 0:
-            success_text = f"🎉 Great job! You found {target_info['name']}! 🎉"
-            success_surface = self.title_font.render(success_text, True, self.colors['yellow'])
+            success_text = f"🎉 Great job! You found {target_name}! 🎉"
+            success_surface = self.render_text(self.title_font, success_text, self.colors['yellow'])
             success_rect = success_surface.get_rect(center=(self.width//2, self.height//2))
             
             # Pulsing effect
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.03)) * 10
+            pulse = abs(math.sin(self._now * 0.03)) * 10
             success_rect.inflate_ip(pulse, pulse)
             
             # Background
@@ -248,44 +259,31 @@ class ColorHuntGame(BaseGame):
     
     def _create_color_particles(self):
         """Create particles based on detected color"""
-        if not self.detected_color:
-            return
-        
-        color_info = self.color_targets.get(self.detected_color)
-        if not color_info:
+        if self.detected_idx < 0:
             return
         
         # Create particles around detection area
         center_x = self.camera_rect.centerx
         center_y = self.camera_rect.centery
         
-        for _ in range(2):
-            x = center_x + random.randint(-60, 60)
-            y = center_y + random.randint(-60, 60)
-            
-            particle = self.create_particle(x, y, color_info['color'], 
-                                          size=random.randint(2, 5))
-            self.particles.append(particle)
+        offsets = self.random_ints(-60, 61, 4)
+        self.create_particles_burst(center_x + offsets[:2], center_y + offsets[2:],
+                                    self.color_values[self.detected_idx], 2,
+                                    size=self.random_ints(2, 6, 2))
     
     def _create_success_particles(self):
         """Create celebration particles when color is found"""
-        target_info = self.color_targets[self.target_color]
+        target_color = self.color_values[self.target_idx]
         
         # Burst of particles from center
         center_x = self.width // 2
         center_y = self.height // 2
         
-        for _ in range(30):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
-            
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            x = center_x + random.randint(-50, 50)
-            y = center_y + random.randint(-50, 50)
-            
-            particle = self.create_particle(x, y, target_info['color'], 
-                                          size=random.randint(3, 8),
-                                          velocity=(vx, vy))
-            self.particles.append(particle)
+        # Random directions and speeds for the whole burst at once
+        count = 30
+        offsets = self.random_ints(-50, 51, count * 2)
+        
+        self.create_particles_burst(center_x + offsets[:count], center_y + offsets[count:],
+                                    target_color, count,
+                                    size=self.random_ints(3, 9, count),
+                                    velocity=self.burst_velocities(count, 2, 8))
@@ -3,15 +3,21 @@ Face Fun Game - Interactive face detection game for kids
 """
 
 import pygame
-import random
 import math
+import cv2
+import numpy as np
 from src.games.base_game import BaseGame
 
+# Rows in the rainbow gradient before it is stretched to the window
+BACKGROUND_STRIP_HEIGHT = 256
+
+# Half-width of the hearts orbiting each face
+HEART_SIZE = 8
+
 class FaceFunGame(BaseGame):
     def __init__(self, screen, camera_manager):
         super().__init__(screen, camera_manager)
         self.faces = []
-        self.particles = []
         self.score = 0
         self.last_face_count = 0
         self.celebration_timer = 0
@@ -19,6 +25,18 @@ class FaceFunGame(BaseGame):
         
         # Face effects
         self.face_effects = []
+        self._sparkle_colors = np.array([self.colors['white'], self.colors['yellow'],
+                                         self.colors['pink']], dtype=np.uint8)
+        self._celebration_colors = np.array([self.colors['yellow'], self.colors['pink'],
+                                             self.colors['orange'], self.colors['purple']],
+                                            dtype=np.uint8)
+        
+        # Angle offsets of the crown points that get drawn and of the orbiting hearts
+        self._crown_offsets = np.arange(4) * (np.pi / 4)
+        self._heart_offsets = np.arange(3) * 2.0
+        
+        # Heart sprites keyed by size, drawn once and then blitted
+        self._heart_sprites = {HEART_SIZE: self._build_heart(HEART_SIZE)}
         
         # Game state
         self.instructions = [
@@ -30,6 +48,12 @@ class FaceFunGame(BaseGame):
         self.current_instruction = 0
         self.instruction_timer = 0
         
+        # Animated background: a thin gradient strip recolored every frame
+        # and stretched into a preallocated full-screen surface
+        self._bg_strip = pygame.Surface((1, BACKGROUND_STRIP_HEIGHT)).convert()
+        self._bg_surf = pygame.Surface((self.width, self.height)).convert()
+        self._bg_rows = np.arange(BACKGROUND_STRIP_HEIGHT, dtype=np.float32) / BACKGROUND_STRIP_HEIGHT
+        
     def update(self):
         """Update face fun game"""
         if not self.running:
@@ -71,6 +95,9 @@ class FaceFunGame(BaseGame):
     
     def draw(self):
         """Draw face fun game"""
+        # One timestamp shared by every animation this frame
+        self._now = pygame.time.get_ticks()
+        
         # Background gradient
         self._draw_background()
         
@@ -89,81 +116,110 @@ class FaceFunGame(BaseGame):
     
     def _draw_background(self):
         """Draw animated background"""
-        # Create rainbow gradient background
-        for y in range(self.height):
-            hue = (y / self.height + pygame.time.get_ticks() * 0.0001) % 1.0
-            color = pygame.Color(0)
-            color.hsva = (hue * 360, 30, 90, 100)  # Light pastel colors
-            pygame.draw.line(self.screen, color, (0, y), (self.width, y))
+        # Rainbow gradient of light pastel colors (OpenCV hue runs 0-180)
+        hue = ((self._bg_rows + self._now * 0.0001) % 1.0) * 180
+        hsv = np.empty((1, BACKGROUND_STRIP_HEIGHT, 3), dtype=np.uint8)
+        hsv[0, :, 0] = hue
+        hsv[0, :, 1] = 76   # 30% saturation
+        hsv[0, :, 2] = 229  # 90% value
+        
+        # Surfaces are indexed (x, y), so the single row above is the strip's one column
+        pygame.surfarray.blit_array(self._bg_strip, cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB))
+        pygame.transform.scale(self._bg_strip, (self.width, self.height), self._bg_surf)
+        self.screen.blit(self._bg_surf, (0, 0))
     
     def _draw_face_overlays(self):
         """Draw fun overlays on detected faces"""
-        for i, face in enumerate(self.faces):
-            # Calculate face position in camera rect
-            face_x = self.camera_rect.x + (face['x'] * self.camera_rect.width) // 640
-            face_y = self.camera_rect.y + (face['y'] * self.camera_rect.height) // 480
-            face_w = (face['width'] * self.camera_rect.width) // 640
-            face_h = (face['height'] * self.camera_rect.height) // 480
-            
+        if not self.faces:
+            return
+        
+        boxes, pulses, crowns, hearts = self._face_geometry()
+        heart = self._heart_sprite(HEART_SIZE)
+        heart_blits = []
+        
+        # Loop invariants as locals
+        screen = self.screen
+        draw_rect = pygame.draw.rect
+        draw_polygon = pygame.draw.polygon
+        yellow = self.colors['yellow']
+        celebrating = self.celebration_timer > 0
+        now = self._now
+        
+        for i, (face_x, face_y, face_w, face_h) in enumerate(boxes):
             # Draw face border with pulsing effect
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.01 + i)) * 5
-            border_color = self.colors['yellow']
+            pulse = pulses[i]
+            border_color = yellow
             
-            if self.celebration_timer > 0:
+            if celebrating:
                 # Rainbow border during celebration
-                hue = (pygame.time.get_ticks() * 0.01 + i) % 1.0
+                hue = (now * 0.01 + i) % 1.0
                 border_color = pygame.Color(0)
                 border_color.hsva = (hue * 360, 100, 100, 100)
             
             # Draw pulsing border
             border_rect = pygame.Rect(face_x - pulse, face_y - pulse, 
                                     face_w + 2*pulse, face_h + 2*pulse)
-            pygame.draw.rect(self.screen, border_color, border_rect, 3)
+            draw_rect(screen, border_color, border_rect, 3)
             
-            # Draw fun accessories
-            self._draw_face_accessories(face_x, face_y, face_w, face_h, i)
+            # Draw fun accessories - a rotating crown and floating hearts
+            draw_polygon(screen, yellow, crowns[i])
+            heart_blits.extend((heart, heart_pos) for heart_pos in hearts[i])
+        
+        # Every heart on screen goes out in a single call
+        screen.blits(heart_blits, doreturn=False)
     
-    def _draw_face_accessories(self, x, y, w, h, face_index):
-        """Draw fun accessories on faces"""
-        center_x = x + w // 2
-        center_y = y + h // 2
-        
-        # Rotating crown
-        crown_angle = pygame.time.get_ticks() * 0.005 + face_index
-        crown_points = []
-        crown_radius = w // 3
-        
-        for i in range(8):
-            angle = crown_angle + i * math.pi / 4
-            point_x = center_x + math.cos(angle) * crown_radius
-            point_y = y - 20 + math.sin(angle) * 10
-            crown_points.append((point_x, point_y))
-        
-        # Draw crown
-        if len(crown_points) >= 3:
-            pygame.draw.polygon(self.screen, self.colors['yellow'], crown_points[:4])
-            
-        # Draw floating hearts
-        for i in range(3):
-            heart_angle = pygame.time.get_ticks() * 0.01 + i * 2
-            heart_x = center_x + math.cos(heart_angle) * (w // 2 + 30)
-            heart_y = center_y + math.sin(heart_angle) * (h // 2 + 20)
-            self._draw_heart(heart_x, heart_y, 8)
+    def _face_geometry(self):
+        """Compute overlay geometry for every face in one NumPy pass"""
+        # Face boxes in camera rect coordinates
+        boxes = np.array([[face['x'], face['y'], face['width'], face['height']] for face in self.faces])
+        camera_size = np.array(self.camera_rect.size * 2)
+        frame_size = np.array((self.camera_manager.frame_width, self.camera_manager.frame_height) * 2)
+        boxes = boxes * camera_size // frame_size
+        boxes[:, :2] += self.camera_rect.topleft
+        x, y, w, h = boxes.T
+        center_x = (x + w // 2)[:, None]
+        center_y = (y + h // 2)[:, None]
+        
+        face_index = np.arange(len(boxes))
+        pulses = np.abs(np.sin(self._now * 0.01 + face_index)) * 5
+        
+        # Only the first four of the eight crown points make up the polygon
+        crown_angles = (self._now * 0.005 + face_index)[:, None] + self._crown_offsets
+        crowns = np.stack([center_x + np.cos(crown_angles) * (w // 3)[:, None],
+                           (y - 20)[:, None] + np.sin(crown_angles) * 10], axis=2)
+        
+        # Hearts circle every face in step - positions come out as integer
+        # top-left corners so the draw loop blits them as they are
+        heart_angles = self._now * 0.01 + self._heart_offsets
+        hearts = np.stack([center_x + np.cos(heart_angles) * (w // 2 + 30)[:, None],
+                           center_y + np.sin(heart_angles) * (h // 2 + 20)[:, None]], axis=2)
+        hearts = hearts.astype(np.int64) - HEART_SIZE
+        
+        return boxes.tolist(), pulses.tolist(), crowns.tolist(), hearts.tolist()
+    
+    def _heart_sprite(self, size):
+        """Get the heart sprite for a size, rendering it on first use"""
+        heart = self._heart_sprites.get(size)
+        if heart is None:
+            heart = self._heart_sprites[size] = self._build_heart(size)
+        return heart
     
-    def _draw_heart(self, x, y, size):
-        """Draw a heart shape"""
+    def _build_heart(self, size):
+        """Render a heart centered in a transparent surface"""
         heart_color = self.colors['pink']
+        heart = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
         
         # Simple heart using circles and triangle
-        pygame.draw.circle(self.screen, heart_color, (int(x - size//2), int(y)), size//2)
-        pygame.draw.circle(self.screen, heart_color, (int(x + size//2), int(y)), size//2)
+        pygame.draw.circle(heart, heart_color, (size - size//2, size), size//2)
+        pygame.draw.circle(heart, heart_color, (size + size//2, size), size//2)
         
         triangle_points = [
-            (x - size, y),
-            (x + size, y),
-            (x, y + size)
+            (0, size),
+            (size * 2, size),
+            (size, size * 2)
         ]
-        pygame.draw.polygon(self.screen, heart_color, triangle_points)
+        pygame.draw.polygon(heart, heart_color, triangle_points)
+        return heart.convert_alpha()
     
     def _draw_game_ui(self):
         """Draw game-specific UI"""
@@ -174,12 +230,12 @@ class FaceFunGame(BaseGame):
         
         # Score
         score_text = f"Fun Points: {self.score} ⭐"
-        score_surface = self.text_font.render(score_text, True, self.colors['white'])
+        score_surface = self.render_text(self.text_font, score_text, self.colors['white'])
         self.screen.blit(score_surface, (self.width - 250, 10))
         
         # Current instruction
         instruction = self.instructions[self.current_instruction]
-        instruction_surface = self.text_font.render(instruction, True, self.colors['black'])
+        instruction_surface = self.render_text(self.text_font, instruction, self.colors['black'])
         
         # Instruction background
         instruction_rect = instruction_surface.get_rect()
@@ -193,52 +249,46 @@ class FaceFunGame(BaseGame):
         
         # Face count
         face_count_text = f"Faces detected: {len(self.faces)}"
-        face_count_surface = self.small_font.render(face_count_text, True, self.colors['black'])
+        face_count_surface = self.render_text(self.small_font, face_count_text, self.colors['black'])
         self.screen.blit(face_count_surface, (self.camera_rect.x, self.camera_rect.bottom + 10))
         
         # Celebration message
         if self.celebration_timer > 0:
             celebration_text = "🎉 Great job! Keep making faces! 🎉"
-            celebration_surface = self.title_font.render(celebration_text, True, self.colors['yellow'])
+            celebration_surface = self.render_text(self.title_font, celebration_text, self.colors['yellow'])
             celebration_rect = celebration_surface.get_rect(center=(self.width//2, self.height//2))
             
             # Pulsing effect
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.02)) * 10
+            pulse = abs(math.sin(self._now * 0.02)) * 10
             celebration_rect.inflate_ip(pulse, pulse)
             
             self.screen.blit(celebration_surface, celebration_rect)
     
     def _create_celebration_particles(self):
         """Create celebration particle effects"""
-        for _ in range(20):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height // 2)
-            color = random.choice([self.colors['yellow'], self.colors['pink'], 
-                                 self.colors['orange'], self.colors['purple']])
-            
-            particle = self.create_particle(x, y, color, size=random.randint(3, 8))
-            self.particles.append(particle)
+        count = 20
+        xs = self._rng.integers(0, self.width + 1, size=count)
+        ys = self._rng.integers(0, self.height // 2 + 1, size=count)
+        colors = self._celebration_colors[self._rng.integers(0, len(self._celebration_colors), size=count)]
+        
+        self.create_particles_burst(xs, ys, colors, count, size=self._rng.integers(3, 9, size=count))
     
     def _create_face_sparkles(self):
         """Create sparkle effects around faces"""
         for face in self.faces:
             # Calculate face position in camera rect
-            face_x = self.camera_rect.x + (face['x'] * self.camera_rect.width) // 640
-            face_y = self.camera_rect.y + (face['y'] * self.camera_rect.height) // 480
-            face_w = (face['width'] * self.camera_rect.width) // 640
-            face_h = (face['height'] * self.camera_rect.height) // 480
+            face_x = self.camera_rect.x + (face['x'] * self.camera_rect.width) // self.camera_manager.frame_width
+            face_y = self.camera_rect.y + (face['y'] * self.camera_rect.height) // self.camera_manager.frame_height
+            face_w = (face['width'] * self.camera_rect.width) // self.camera_manager.frame_width
+            face_h = (face['height'] * self.camera_rect.height) // self.camera_manager.frame_height
             
             # Create sparkles around face
-            for _ in range(3):
-                sparkle_x = face_x + random.randint(-face_w//2, face_w + face_w//2)
-                sparkle_y = face_y + random.randint(-face_h//2, face_h + face_h//2)
-                
-                sparkle_color = random.choice([self.colors['white'], self.colors['yellow'], 
-                                             self.colors['pink']])
-                
-                particle = self.create_particle(sparkle_x, sparkle_y, sparkle_color, 
-                                              size=2, velocity=(0, -1))
-                self.particles.append(particle)
+            sparkle_x = face_x + self.random_ints(-face_w//2, face_w + face_w//2 + 1, 3)
+            sparkle_y = face_y + self.random_ints(-face_h//2, face_h + face_h//2 + 1, 3)
+            sparkle_colors = self._sparkle_colors[self.random_ints(0, 3, 3)]
+            
+            self.create_particles_burst(sparkle_x, sparkle_y, sparkle_colors, 3,
+                                        size=2, velocity=(0, -1))
     
     def _update_face_effects(self):
         """Update face-based effects"""
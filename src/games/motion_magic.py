@@ -5,17 +5,90 @@ Motion Magic Game - Interactive hand/motion detection game for kids
 import pygame
 import random
 import math
+import numpy as np
 from src.games.base_game import BaseGame
+from src.games import _particle_kernels as kernels
+
+# Twinkling stars in the background and height of each aurora band
+BACKGROUND_STARS = 50
+AURORA_BAND_HEIGHT = 10
+
+# Falling stars are drawn from sprites cached per rotation step. Each cache
+# entry holds every rotation of one (size, color) pair, and there is room for
+# all 48 pairs a star can spawn with (sizes 8-15 in six magic colors)
+STAR_ROTATION_STEPS = 32
+STAR_CACHE_SIZE = 48
+
+# CameraManager tracks at most two hands, so there are never more wands
+MAX_WANDS = 2
+
+class ObjectPool:
+    """Fixed-capacity parallel arrays - live objects occupy the first `count` slots"""
+    
+    def __init__(self, capacity, **fields):
+        self.capacity = capacity
+        self.count = 0
+        
+        # fields maps each name to its dtype, or to (dtype, per-object shape)
+        self._arrays = {}
+        for name, spec in fields.items():
+            dtype, shape = spec if isinstance(spec, tuple) else (spec, ())
+            self._arrays[name] = np.zeros((capacity, *shape), dtype=dtype)
+    
+    def __len__(self):
+        return self.count
+    
+    def __getitem__(self, name):
+        """View of one field for the live objects - updates write through"""
+        return self._arrays[name][:self.count]
+    
+    def __setitem__(self, name, values):
+        """Overwrite one field for the live objects (lets `pool[name] += ...` work)"""
+        self._arrays[name][:self.count] = values
+    
+    def add(self, **values):
+        """Add one object (dropped when the pool is full)"""
+        if self.count >= self.capacity:
+            return
+        
+        for name, value in values.items():
+            self._arrays[name][self.count] = value
+        self.count += 1
+    
+    def clear(self):
+        """Forget every object without touching the storage"""
+        self.count = 0
+    
+    def keep(self, mask):
+        """Compact the objects whose mask entry is True to the front"""
+        n = self.count
+        survivors = int(np.count_nonzero(mask))
+        if survivors < n:
+            for array in self._arrays.values():
+                array[:survivors] = array[:n][mask]
+        self.count = survivors
 
 class MotionMagicGame(BaseGame):
     def __init__(self, screen, camera_manager):
         super().__init__(screen, camera_manager)
         self.hands = []
-        self.magic_wands = []
-        self.falling_stars = []
-        self.particles = []
         self.score = 0
-        self.magic_trails = []
+        
+        # Screen position of each detected hand, worked out once per update
+        self._hand_positions = np.zeros((0, 2), dtype=np.int64)
+        
+        # Wands, stars and trails live in preallocated pools of parallel arrays
+        self.magic_wands = ObjectPool(
+            MAX_WANDS, x=np.float32, y=np.float32, size=np.float32, color=(np.uint8, (3,))
+        )
+        self.falling_stars = ObjectPool(
+            256, x=np.float32, y=np.float32, vx=np.float32, vy=np.float32,
+            size=np.float32, rotation=np.float32, color=(np.uint8, (3,))
+        )
+        self.magic_trails = ObjectPool(
+            128, x=np.float32, y=np.float32, size=np.float32, life=np.float32,
+            color=(np.uint8, (3,))
+        )
         
         # Game elements
         self.star_spawn_timer = 0
@@ -26,14 +99,37 @@ class MotionMagicGame(BaseGame):
             self.colors['purple'], self.colors['pink'], self.colors['yellow'],
             self.colors['blue'], self.colors['green'], (255, 100, 255)  # Magenta
         ]
+        self._magic_palette = np.array(self.magic_colors, dtype=np.uint8)
+        
+        # Falling star rotation sprites keyed by (size, color), oldest first
+        self._star_cache = {}
+        
+        # Background stars sit at fixed pseudo-random positions and only change
+        # brightness - one small sprite per brightness level is drawn on demand
+        star_index = np.arange(BACKGROUND_STARS)
+        self._sky_star_phases = star_index.astype(np.float64)
+        self._sky_star_corners = list(zip(((star_index * 137) % self.width - 2).tolist(),
+                                          ((star_index * 211) % self.height - 2).tolist()))
+        self._sky_star_sprites = {}
+        
+        # Aurora bands are uniform across the screen, so they are recolored in a
+        # persistent one-pixel-per-band column and stretched over the screen
+        self._aurora_rows = np.arange(0, self.height, AURORA_BAND_HEIGHT)
+        self._aurora = pygame.Surface((1, len(self._aurora_rows)), pygame.SRCALPHA).convert_alpha()
+        self._aurora_scaled = pygame.Surface((self.width, len(self._aurora_rows) * AURORA_BAND_HEIGHT),
+                                             pygame.SRCALPHA).convert_alpha()
         
     def update(self):
         """Update motion magic game"""
         if not self.running:
             return
         
+        # One timestamp shared by everything animated this update
+        self._now = pygame.time.get_ticks()
+        
         # Detect hands
         self.hands = self.camera_manager.detect_hands()
+        self._hand_positions = self._hand_screen_positions()
         
         # Update magic wands based on hand positions
         self._update_magic_wands()
@@ -57,6 +153,9 @@ class MotionMagicGame(BaseGame):
     
     def draw(self):
         """Draw motion magic game"""
+        # One timestamp shared by every animation this frame
+        self._now = pygame.time.get_ticks()
+        
         # Magical background
         self._draw_magical_background()
         
@@ -86,190 +185,222 @@ class MotionMagicGame(BaseGame):
     
     def _draw_magical_background(self):
         """Draw animated magical background"""
+        ticks = self._now
+        
         # Dark starry background
         self.screen.fill((20, 20, 40))
         
         # Draw twinkling stars
-        for i in range(50):
-            star_x = (i * 137) % self.width  # Pseudo-random positions
-            star_y = (i * 211) % self.height
-            
-            # Twinkling effect
-            twinkle = abs(math.sin(pygame.time.get_ticks() * 0.01 + i)) * 255
-            star_color = (int(twinkle), int(twinkle), 255)
-            
-            pygame.draw.circle(self.screen, star_color, (star_x, star_y), 2)
+        twinkles = (np.abs(np.sin(ticks * 0.01 + self._sky_star_phases)) * 255).astype(np.int64)
+        sprites = self._sky_star_sprites
+        self.screen.blits([
+            (sprites[twinkle] if twinkle in sprites else self._sky_star_sprite(twinkle), corner)
+            for twinkle, corner in zip(twinkles.tolist(), self._sky_star_corners)
+        ], doreturn=False)
         
         # Draw magical aurora effect
-        time = pygame.time.get_ticks() * 0.001
-        for y in range(0, self.height, 10):
-            wave = math.sin(time + y * 0.01) * 30
-            alpha = abs(math.sin(time * 0.5 + y * 0.005)) * 50
-            
-            color = (int(100 + wave), int(50 + alpha), int(150 + wave), int(alpha))
-            
-            # Create surface with alpha for aurora effect
-            aurora_surface = pygame.Surface((self.width, 10), pygame.SRCALPHA)
-            aurora_surface.fill(color)
-            self.screen.blit(aurora_surface, (0, y))
+        time = ticks * 0.001
+        rows = self._aurora_rows
+        wave = np.sin(time + rows * 0.01) * 30
+        alpha = np.abs(np.sin(time * 0.5 + rows * 0.005)) * 50
+        
+        # Surfaces are indexed (x, y) - the column's single x holds the band colors
+        rgb = pygame.surfarray.pixels3d(self._aurora)
+        rgb[0, :, 0] = (100 + wave).astype(np.uint8)
+        rgb[0, :, 1] = (50 + alpha).astype(np.uint8)
+        rgb[0, :, 2] = (150 + wave).astype(np.uint8)
+        del rgb
+        pixel_alpha = pygame.surfarray.pixels_alpha(self._aurora)
+        pixel_alpha[0] = alpha.astype(np.uint8)
+        del pixel_alpha
+        
+        pygame.transform.scale(self._aurora, self._aurora_scaled.get_size(), self._aurora_scaled)
+        self.screen.blit(self._aurora_scaled, (0, 0))
+    
+    def _sky_star_sprite(self, twinkle):
+        """Render and cache a background star at one brightness"""
+        sprite = pygame.Surface((5, 5), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (twinkle, twinkle, 255), (2, 2), 2)
+        sprite = sprite.convert_alpha()
+        self._sky_star_sprites[twinkle] = sprite
+        return sprite
+    
+    def _hand_screen_positions(self):
+        """Convert every hand center from camera to screen coordinates in one pass"""
+        centers = np.array([hand['center'] for hand in self.hands], dtype=np.int64).reshape(-1, 2)
+        frame_size = (self.camera_manager.frame_width, self.camera_manager.frame_height)
+        return centers * self.camera_rect.size // frame_size + self.camera_rect.topleft
     
     def _update_magic_wands(self):
         """Update magic wands based on hand positions"""
         # Clear old wands
-        self.magic_wands = []
+        self.magic_wands.clear()
         
-        for i, hand in enumerate(self.hands):
-            # Convert hand position to screen coordinates
-            hand_x = self.camera_rect.x + (hand['center'][0] * self.camera_rect.width) // 640
-            hand_y = self.camera_rect.y + (hand['center'][1] * self.camera_rect.height) // 480
-            
+        now = self._now
+        for i, (hand_x, hand_y) in enumerate(self._hand_positions.tolist()):
             # Create magic wand
             wand_color = self.magic_colors[i % len(self.magic_colors)]
-            self.magic_wands.append({
-                'x': hand_x,
-                'y': hand_y,
-                'color': wand_color,
-                'size': 20 + abs(math.sin(pygame.time.get_ticks() * 0.01 + i)) * 10
-            })
+            self.magic_wands.add(
+                x=hand_x,
+                y=hand_y,
+                color=wand_color,
+                size=20 + abs(math.sin(now * 0.01 + i)) * 10
+            )
             
             # Add to magic trail
-            self.magic_trails.append({
-                'x': hand_x,
-                'y': hand_y,
-                'color': wand_color,
-                'life': 30,
-                'size': 15
-            })
+            self.magic_trails.add(x=hand_x, y=hand_y, color=wand_color, life=30, size=15)
     
     def _spawn_falling_star(self):
         """Spawn a new falling star"""
-        star = {
-            'x': random.randint(0, self.width),
-            'y': -20,
-            'vx': random.uniform(-2, 2),
-            'vy': random.uniform(2, 5),
-            'color': random.choice(self.magic_colors),
-            'size': random.randint(8, 15),
-            'rotation': 0,
-            'caught': False
-        }
-        self.falling_stars.append(star)
+        self.falling_stars.add(
+            x=random.randint(0, self.width),
+            y=-20,
+            vx=random.uniform(-2, 2),
+            vy=random.uniform(2, 5),
+            color=random.choice(self.magic_colors),
+            size=random.randint(8, 15),
+            rotation=0
+        )
     
     def _update_falling_stars(self):
         """Update falling stars and check for catches"""
-        for star in self.falling_stars[:]:
-            if star['caught']:
-                continue
-            
-            # Move star
-            star['x'] += star['vx']
-            star['y'] += star['vy']
-            star['rotation'] += 0.1
-            
-            # Check collision with magic wands
-            for wand in self.magic_wands:
-                distance = math.sqrt((star['x'] - wand['x'])**2 + (star['y'] - wand['y'])**2)
-                if distance < wand['size'] + star['size']:
-                    # Star caught!
-                    star['caught'] = True
-                    self.score += 10
-                    self._create_star_catch_effect(star['x'], star['y'], star['color'])
-                    break
+        stars = self.falling_stars
+        wands = self.magic_wands
+        caught = np.zeros(len(stars), dtype=bool)
+        
+        if kernels.HAS_NUMBA:
+            # Move and collide every star in one compiled pass
+            kernels.step_stars(stars['x'], stars['y'], stars['vx'], stars['vy'],
+                               stars['rotation'], stars['size'],
+                               wands['x'], wands['y'], wands['size'], caught)
+        else:
+            # Move every star at once
+            stars['x'] += stars['vx']
+            stars['y'] += stars['vy']
+            stars['rotation'] += 0.1
             
-            # Remove stars that fall off screen
-            if star['y'] > self.height + 50:
-                self.falling_stars.remove(star)
+            # Check every star against every magic wand in one broadcast. With at
+            # most MAX_WANDS wands this is a couple of squared distances per star,
+            # less work than sorting stars into a spatial grid would be.
+            if len(wands) and len(caught):
+                dx = stars['x'][:, None] - wands['x']
+                dy = stars['y'][:, None] - wands['y']
+                reach = stars['size'][:, None] + wands['size']
+                caught = (dx * dx + dy * dy < reach * reach).any(axis=1)
+        
+        # Star caught!
+        for i in np.flatnonzero(caught).tolist():
+            self.score += 10
+            self._create_star_catch_effect(stars['x'][i], stars['y'][i], stars['color'][i])
         
-        # Remove caught stars after effect
-        self.falling_stars = [star for star in self.falling_stars if not star['caught']]
+        # Keep stars that are neither caught nor off screen
+        stars.keep(~caught & (stars['y'] <= self.height + 50))
     
     def _update_magic_trails(self):
         """Update magic trails behind hands"""
-        for trail in self.magic_trails[:]:
-            trail['life'] -= 1
-            trail['size'] *= 0.95
-            
-            if trail['life'] <= 0 or trail['size'] < 1:
-                self.magic_trails.remove(trail)
+        trails = self.magic_trails
+        trails['life'] -= 1
+        trails['size'] *= 0.95
+        
+        trails.keep((trails['life'] > 0) & (trails['size'] >= 1))
     
     def _draw_hand_overlays(self):
         """Draw magical overlays on detected hands"""
-        for i, hand in enumerate(self.hands):
-            # Convert hand position to screen coordinates
-            hand_x = self.camera_rect.x + (hand['center'][0] * self.camera_rect.width) // 640
-            hand_y = self.camera_rect.y + (hand['center'][1] * self.camera_rect.height) // 480
-            
-            # Draw magical aura around hand
+        auras = []
+        outlines = []
+        now = self._now
+        for i, (hand_x, hand_y) in enumerate(self._hand_positions.tolist()):
+            # Magical aura around hand
             aura_color = self.magic_colors[i % len(self.magic_colors)]
-            aura_size = 30 + abs(math.sin(pygame.time.get_ticks() * 0.02 + i)) * 15
-            
-            # Create aura surface with alpha
-            aura_surface = pygame.Surface((aura_size * 2, aura_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(aura_surface, (*aura_color, 100), 
-                             (aura_size, aura_size), aura_size)
-            
-            self.screen.blit(aura_surface, (hand_x - aura_size, hand_y - aura_size))
-            
-            # Draw hand outline
-            pygame.draw.circle(self.screen, self.colors['white'], (hand_x, hand_y), 15, 3)
+            aura_size = int(30 + abs(math.sin(now * 0.02 + i)) * 15)
+            auras.append((self.circle_sprite(aura_size, (*aura_color, 100)),
+                          (hand_x - aura_size, hand_y - aura_size)))
+            outlines.append((hand_x, hand_y))
+        
+        self.screen.blits(auras, doreturn=False)
+        
+        # Draw hand outlines
+        for center in outlines:
+            pygame.draw.circle(self.screen, self.colors['white'], center, 15, 3)
     
     def _draw_magic_wands(self):
         """Draw magic wands at hand positions"""
-        for wand in self.magic_wands:
-            # Draw wand glow
-            glow_surface = pygame.Surface((wand['size'] * 3, wand['size'] * 3), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*wand['color'], 80), 
-                             (wand['size'] * 3 // 2, wand['size'] * 3 // 2), wand['size'])
-            
-            self.screen.blit(glow_surface, (wand['x'] - wand['size'] * 3 // 2, 
-                                          wand['y'] - wand['size'] * 3 // 2))
-            
+        wands = self.magic_wands
+        wand_list = list(zip(wands['x'].tolist(), wands['y'].tolist(),
+                             wands['size'].tolist(), map(tuple, wands['color'].tolist())))
+        
+        # Draw every wand glow in one call
+        self.screen.blits([
+            (self.circle_sprite(int(size), (*color, 80)), (x - int(size), y - int(size)))
+            for x, y, size, color in wand_list
+        ], doreturn=False)
+        
+        for x, y, size, color in wand_list:
             # Draw wand core
-            pygame.draw.circle(self.screen, wand['color'], 
-                             (int(wand['x']), int(wand['y'])), int(wand['size'] // 2))
+            pygame.draw.circle(self.screen, color, 
+                             (int(x), int(y)), int(size // 2))
             pygame.draw.circle(self.screen, self.colors['white'], 
-                             (int(wand['x']), int(wand['y'])), int(wand['size'] // 2), 2)
+                             (int(x), int(y)), int(size // 2), 2)
     
     def _draw_falling_stars(self):
         """Draw falling stars"""
-        for star in self.falling_stars:
-            if star['caught']:
-                continue
-            
-            # Draw star shape
-            self._draw_star(star['x'], star['y'], star['size'], star['color'], star['rotation'])
+        stars = self.falling_stars
+        
+        # Rotations snap to a fixed number of steps so star sprites can be reused
+        buckets = (stars['rotation'] * (STAR_ROTATION_STEPS / (2 * math.pi))).astype(np.int64) % STAR_ROTATION_STEPS
+        sizes = stars['size'].astype(np.int64)
+        lefts = stars['x'].astype(np.int64) - sizes - 2
+        tops = stars['y'].astype(np.int64) - sizes - 2
+        
+        cache = self._star_cache
+        blits = []
+        for size, color, bucket in zip(sizes.tolist(), map(tuple, stars['color'].tolist()), buckets.tolist()):
+            rotations = cache.get((size, color))
+            if rotations is None:
+                rotations = self._star_rotations(size, color)
+            sprite = rotations[bucket]
+            if sprite is None:
+                sprite = rotations[bucket] = self._star_sprite(size, color, bucket)
+            blits.append(sprite)
+        
+        self.screen.blits(list(zip(blits, zip(lefts.tolist(), tops.tolist()))), doreturn=False)
     
-    def _draw_star(self, x, y, size, color, rotation):
-        """Draw a star shape"""
-        points = []
-        for i in range(10):  # 5-pointed star = 10 points
-            angle = rotation + i * math.pi / 5
-            if i % 2 == 0:
-                # Outer points
-                radius = size
-            else:
-                # Inner points
-                radius = size * 0.4
-            
-            point_x = x + math.cos(angle) * radius
-            point_y = y + math.sin(angle) * radius
-            points.append((point_x, point_y))
+    def _star_rotations(self, size, color):
+        """Add an empty set of rotation sprites for a star, evicting the oldest star when full"""
+        if len(self._star_cache) >= STAR_CACHE_SIZE:
+            del self._star_cache[next(iter(self._star_cache))]
+        rotations = self._star_cache[(size, color)] = [None] * STAR_ROTATION_STEPS
+        return rotations
+    
+    def _star_sprite(self, size, color, bucket):
+        """Render a star at a rotation step"""
+        # 5-pointed star = 10 points alternating between outer and inner radius
+        angles = bucket * (2 * math.pi / STAR_ROTATION_STEPS) + np.arange(10) * (math.pi / 5)
+        radii = np.where(np.arange(10) % 2 == 0, size, size * 0.4)
         
-        if len(points) >= 3:
-            pygame.draw.polygon(self.screen, color, points)
-            pygame.draw.polygon(self.screen, self.colors['white'], points, 2)
+        # Leave room for the outline around the outer points
+        center = size + 2
+        points = np.stack([center + np.cos(angles) * radii,
+                           center + np.sin(angles) * radii], axis=1).tolist()
+        
+        sprite = pygame.Surface((center * 2 + 1, center * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.polygon(sprite, color, points)
+        pygame.draw.polygon(sprite, self.colors['white'], points, 2)
+        return sprite.convert_alpha()
     
     def _draw_magic_trails(self):
         """Draw magic trails behind hands"""
-        for trail in self.magic_trails:
-            alpha = int(255 * (trail['life'] / 30))
-            trail_color = (*trail['color'], alpha)
-            
-            trail_surface = pygame.Surface((trail['size'] * 2, trail['size'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface, trail_color, 
-                             (int(trail['size']), int(trail['size'])), int(trail['size']))
-            
-            self.screen.blit(trail_surface, (trail['x'] - trail['size'], trail['y'] - trail['size']))
+        trails = self.magic_trails
+        alphas = (255 * (trails['life'] / 30)).astype(np.int64)
+        radii = trails['size'].astype(np.int64)
+        
+        # Trails fade out as they shrink, so each (radius, alpha) pair recurs every frame
+        self.screen.blits([
+            (self.circle_sprite(radius, (*color, alpha)), (x - size, y - size))
+            for x, y, size, radius, alpha, color in zip(
+                trails['x'].tolist(), trails['y'].tolist(), trails['size'].tolist(),
+                radii.tolist(), alphas.tolist(), map(tuple, trails['color'].tolist()))
+        ], doreturn=False)
     
     def _draw_game_ui(self):
         """Draw game-specific UI"""
@@ -280,12 +411,12 @@ class MotionMagicGame(BaseGame):
         
         # Score
         score_text = f"Stars Caught: {self.score} ⭐"
-        score_surface = self.text_font.render(score_text, True, self.colors['white'])
+        score_surface = self.render_text(self.text_font, score_text, self.colors['white'])
         self.screen.blit(score_surface, (self.width - 250, 10))
         
         # Hand count
         hand_count_text = f"Magic Wands: {len(self.hands)} 🪄"
-        hand_surface = self.text_font.render(hand_count_text, True, self.colors['white'])
+        hand_surface = self.render_text(self.text_font, hand_count_text, self.colors['white'])
         self.screen.blit(hand_surface, (self.camera_rect.x, self.camera_rect.bottom + 10))
         
         # Instructions
@@ -295,57 +426,57 @@ class MotionMagicGame(BaseGame):
             "✨ Move around to create magical trails"
         ]
         
+        screen = self.screen
+        font = self.small_font
+        white = self.colors['white']
+        center_x = self.width // 2
         instruction_y = self.height - 200
         for instruction in instructions:
-            text_surface = self.small_font.render(instruction, True, self.colors['white'])
-            text_rect = text_surface.get_rect(center=(self.width//2, instruction_y))
+            text_surface = self.render_text(font, instruction, white)
+            text_rect = text_surface.get_rect(center=(center_x, instruction_y))
             
             # Background for readability
             bg_rect = text_rect.inflate(10, 5)
-            pygame.draw.rect(self.screen, (0, 0, 0, 128), bg_rect, border_radius=5)
+            pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect, border_radius=5)
             
-            self.screen.blit(text_surface, text_rect)
+            screen.blit(text_surface, text_rect)
             instruction_y += 25
         
         # Active stars count
-        active_stars = len([star for star in self.falling_stars if not star['caught']])
+        active_stars = len(self.falling_stars)
         stars_text = f"Active Stars: {active_stars}"
-        stars_surface = self.small_font.render(stars_text, True, self.colors['yellow'])
+        stars_surface = self.render_text(self.small_font, stars_text, self.colors['yellow'])
         self.screen.blit(stars_surface, (10, self.height - 100))
     
     def _create_hand_particles(self):
         """Create magical particles from hand positions"""
-        for i, hand in enumerate(self.hands):
-            if random.random() < 0.5:  # 50% chance each frame
-                # Convert hand position to screen coordinates
-                hand_x = self.camera_rect.x + (hand['center'][0] * self.camera_rect.width) // 640
-                hand_y = self.camera_rect.y + (hand['center'][1] * self.camera_rect.height) // 480
-                
-                # Create sparkle particle
-                color = self.magic_colors[i % len(self.magic_colors)]
-                particle = self.create_particle(
-                    hand_x + random.randint(-20, 20),
-                    hand_y + random.randint(-20, 20),
-                    color,
-                    size=random.randint(2, 6),
-                    velocity=(random.uniform(-2, 2), random.uniform(-3, 1))
-                )
-                self.particles.append(particle)
+        # 50% chance for each hand every frame
+        emitting = np.flatnonzero(self._rng.random(len(self.hands)) < 0.5)
+        count = len(emitting)
+        if count == 0:
+            return
+        
+        # Create one sparkle particle per emitting hand in a single batch
+        positions = self._hand_positions[emitting] + self._rng.integers(-20, 21, size=(count, 2))
+        self.create_particles_burst(
+            positions[:, 0],
+            positions[:, 1],
+            self._magic_palette[emitting % len(self.magic_colors)],
+            count,
+            size=self._rng.integers(2, 7, size=count),
+            velocity=(self._rng.uniform(-2, 2, count), self._rng.uniform(-3, 1, count))
+        )
     
     def _create_star_catch_effect(self, x, y, color):
         """Create particle effect when star is caught"""
-        for _ in range(15):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            particle = self.create_particle(
-                x + random.randint(-10, 10),
-                y + random.randint(-10, 10),
-                color,
-                size=random.randint(3, 8),
-                velocity=(vx, vy)
-            )
-            self.particles.append(particle)
+        count = 15
+        offsets = self.random_ints(-10, 11, count * 2)
+        
+        self.create_particles_burst(
+            x + offsets[:count],
+            y + offsets[count:],
+            color,
+            count,
+            size=self.random_ints(3, 9, count),
+            velocity=self.burst_velocities(count, 2, 6)
+        )
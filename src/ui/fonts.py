@@ -0,0 +1,18 @@
+"""
+Fonts - Shared font objects for the menu and games
+"""
+
+import pygame
+
+_fonts = {}
+
+def get_font(size):
+    """Get the shared default font of the given size"""
+    font = _fonts.get(size)
+    if font is None:
+        if not _fonts:
+            # Fonts are invalid after pygame.quit(), so forget them when it runs
+            pygame.register_quit(_fonts.clear)
+        font = pygame.font.Font(None, size)
+        _fonts[size] = font
+    return font
@@ -4,6 +4,8 @@ Main Menu UI - Kid-friendly game selection screen
 
 import pygame
 import math
+import numpy as np
+from src.ui.fonts import get_font
 
 class MainMenu:
     def __init__(self, screen):
@@ -24,15 +26,9 @@ class MainMenu:
         }
         
         # Fonts
-        try:
-            self.title_font = pygame.font.Font(None, 72)
-            self.button_font = pygame.font.Font(None, 48)
-            self.subtitle_font = pygame.font.Font(None, 36)
-        except:
-            # Fallback to default font
-            self.title_font = pygame.font.Font(None, 72)
-            self.button_font = pygame.font.Font(None, 48)
-            self.subtitle_font = pygame.font.Font(None, 36)
+        self.title_font = get_font(72)
+        self.button_font = get_font(48)
+        self.subtitle_font = get_font(36)
         
         # Button setup
         self.buttons = self._create_buttons()
@@ -41,6 +37,17 @@ class MainMenu:
         # Animation
         self.animation_time = 0
         
+        # The gradient never changes and clouds only move, so both are drawn once
+        self._background = self._build_background()
+        self._cloud_sprites = {}
+        
+        # Finished button images keyed by (name, color, size) - hover pulses
+        # only ever produce a handful of sizes
+        self._button_sprites = {}
+        
+        # Menu text never changes, so it is rendered once as (surface, position) pairs
+        self._title_text, self._instruction_text = self._render_menu_text()
+        
     def _create_buttons(self):
         """Create game mode buttons"""
         button_width = 250
@@ -103,37 +110,41 @@ class MainMenu:
     def draw(self):
         """Draw the main menu"""
         # Background gradient effect
-        for y in range(self.height):
-            color_ratio = y / self.height
-            r = int(135 + (173 - 135) * color_ratio)  # Sky blue to light blue
-            g = int(206 + (216 - 206) * color_ratio)
-            b = int(235 + (230 - 235) * color_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.width, y))
+        self.screen.blit(self._background, (0, 0))
         
         # Draw floating clouds
         self._draw_clouds()
         
+        # Title with shadow and subtitle
+        self.screen.blits(self._title_text, doreturn=False)
+        
+        # Draw buttons
+        self.screen.blits([self._button_sprite(button) for button in self.buttons], doreturn=False)
+        
+        # Instructions
+        self.screen.blits(self._instruction_text, doreturn=False)
+    
+    def _render_menu_text(self):
+        """Render the title, subtitle and instructions with their positions"""
         # Title with shadow
         title_text = "Kid Cam Game PC"
-        title_shadow = self.title_font.render(title_text, True, self.colors['shadow'])
-        title_surface = self.title_font.render(title_text, True, self.colors['title'])
+        title_shadow = self.title_font.render(title_text, True, self.colors['shadow']).convert_alpha()
+        title_surface = self.title_font.render(title_text, True, self.colors['title']).convert_alpha()
         
         title_x = (self.width - title_surface.get_width()) // 2
         title_y = 80
         
-        # Draw shadow offset
-        self.screen.blit(title_shadow, (title_x + 3, title_y + 3))
-        self.screen.blit(title_surface, (title_x, title_y))
-        
         # Subtitle
         subtitle_text = "Choose your adventure! 🎮📷"
-        subtitle_surface = self.subtitle_font.render(subtitle_text, True, self.colors['text'])
+        subtitle_surface = self.subtitle_font.render(subtitle_text, True, self.colors['text']).convert_alpha()
         subtitle_x = (self.width - subtitle_surface.get_width()) // 2
-        self.screen.blit(subtitle_surface, (subtitle_x, title_y + 90))
         
-        # Draw buttons
-        for button in self.buttons:
-            self._draw_button(button)
+        # Shadow goes first, offset behind the title
+        title_blits = [
+            (title_shadow, (title_x + 3, title_y + 3)),
+            (title_surface, (title_x, title_y)),
+            (subtitle_surface, (subtitle_x, title_y + 90))
+        ]
         
         # Instructions
         instructions = [
@@ -142,48 +153,81 @@ class MainMenu:
             "⌨️ Press ESC to exit games"
         ]
         
+        instruction_blits = []
         instruction_y = self.height - 120
         for instruction in instructions:
-            text_surface = self.subtitle_font.render(instruction, True, self.colors['text'])
+            text_surface = self.subtitle_font.render(instruction, True, self.colors['text']).convert_alpha()
             text_x = (self.width - text_surface.get_width()) // 2
-            self.screen.blit(text_surface, (text_x, instruction_y))
+            instruction_blits.append((text_surface, (text_x, instruction_y)))
             instruction_y += 30
+        
+        return title_blits, instruction_blits
     
-    def _draw_button(self, button):
-        """Draw a single button with hover effects"""
+    def _build_background(self):
+        """Render the sky blue to light blue gradient"""
+        color_ratio = np.arange(self.height) / self.height
+        top = np.array((135, 206, 235))
+        bottom = np.array((173, 216, 230))
+        rows = (top + (bottom - top) * color_ratio[:, None]).astype(np.uint8)
+        
+        # Surfaces are indexed (x, y), so repeat the row colors across the width
+        pixels = np.ascontiguousarray(np.broadcast_to(rows[None, :, :], (self.width, self.height, 3)))
+        return pygame.surfarray.make_surface(pixels).convert()
+    
+    def _button_sprite(self, button):
+        """Get a button's image and screen position, with hover effects"""
         rect = button['rect']
         color = button['color']
         
         # Hover effect
         if self.hovered_button == button['name']:
             # Pulsing effect
-            pulse = abs(math.sin(self.animation_time * 3)) * 10
+            pulse = int(abs(math.sin(self.animation_time * 3)) * 10)
             expanded_rect = rect.inflate(pulse, pulse)
             color = self.colors['button_hover']
         else:
             expanded_rect = rect
         
-        # Draw button shadow
-        shadow_rect = expanded_rect.move(5, 5)
-        pygame.draw.rect(self.screen, self.colors['shadow'], shadow_rect, border_radius=15)
+        key = (button['name'], color, expanded_rect.size)
+        sprite = self._button_sprites.get(key)
+        if sprite is None:
+            sprite = self._button_sprites[key] = self._build_button(button, color, expanded_rect.size)
         
-        # Draw button
-        pygame.draw.rect(self.screen, color, expanded_rect, border_radius=15)
-        pygame.draw.rect(self.screen, self.colors['text'], expanded_rect, 3, border_radius=15)
+        surface, offset = sprite
+        return surface, (expanded_rect.x + offset[0], expanded_rect.y + offset[1])
+    
+    def _build_button(self, button, color, size):
+        """Render a button at one size, returning the image and its offset from the button's corner"""
+        button_rect = pygame.Rect((0, 0), size)
         
-        # Draw button text
+        # Render button text
         title_surface = self.button_font.render(button['title'], True, self.colors['text'])
         subtitle_surface = self.subtitle_font.render(button['subtitle'], True, self.colors['text'])
         
         # Center text
-        title_x = expanded_rect.centerx - title_surface.get_width() // 2
-        title_y = expanded_rect.centery - title_surface.get_height() // 2 - 10
+        title_rect = title_surface.get_rect(x=button_rect.centerx - title_surface.get_width() // 2,
+                                            y=button_rect.centery - title_surface.get_height() // 2 - 10)
+        subtitle_rect = subtitle_surface.get_rect(x=button_rect.centerx - subtitle_surface.get_width() // 2,
+                                                  y=title_rect.y + title_surface.get_height() + 5)
         
-        subtitle_x = expanded_rect.centerx - subtitle_surface.get_width() // 2
-        subtitle_y = title_y + title_surface.get_height() + 5
+        # Long text may stick out of the button, so the image covers everything drawn
+        shadow_rect = button_rect.move(5, 5)
+        bounds = button_rect.unionall([shadow_rect, title_rect, subtitle_rect])
+        offset = bounds.topleft
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
         
-        self.screen.blit(title_surface, (title_x, title_y))
-        self.screen.blit(subtitle_surface, (subtitle_x, subtitle_y))
+        # Draw button shadow
+        pygame.draw.rect(surface, self.colors['shadow'], shadow_rect.move(-offset[0], -offset[1]), border_radius=15)
+        
+        # Draw button
+        body_rect = button_rect.move(-offset[0], -offset[1])
+        pygame.draw.rect(surface, color, body_rect, border_radius=15)
+        pygame.draw.rect(surface, self.colors['text'], body_rect, 3, border_radius=15)
+        
+        surface.blit(title_surface, title_rect.move(-offset[0], -offset[1]))
+        surface.blit(subtitle_surface, subtitle_rect.move(-offset[0], -offset[1]))
+        
+        return surface.convert_alpha(), offset
     
     def _draw_clouds(self):
         """Draw animated clouds in background"""
@@ -203,6 +247,14 @@ class MainMenu:
     
     def _draw_cloud(self, x, y, size):
         """Draw a single fluffy cloud"""
+        cloud_surface = self._cloud_sprites.get(size)
+        if cloud_surface is None:
+            cloud_surface = self._cloud_sprites[size] = self._build_cloud(size)
+        
+        self.screen.blit(cloud_surface, (x, y))
+    
+    def _build_cloud(self, size):
+        """Render a cloud of one size"""
         cloud_color = (255, 255, 255, 180)  # Semi-transparent white
         
         # Create cloud surface with alpha
@@ -214,4 +266,4 @@ class MainMenu:
         pygame.draw.circle(cloud_surface, cloud_color, (size//4, size//3), size//5)
         pygame.draw.circle(cloud_surface, cloud_color, (size*3//2, size//3), size//4)
         
-        self.screen.blit(cloud_surface, (x, y))
+        return cloud_surface.convert_alpha()
@@ -2,9 +2,58 @@
 Camera Manager - Handles camera input and processing
 """
 
+import os
+import threading
+import time
 import cv2
 import numpy as np
 import mediapipe as mp
+import pygame
+from src.utils.camera_cache import load_camera_index, preferred_backend
+
+# Capture at the on-screen camera size so frames need no rescaling
+CAPTURE_WIDTH = 320
+CAPTURE_HEIGHT = 240
+
+# Size of the grayscale frame handed to CV analysis
+ANALYSIS_SIZE = (160, 120)
+
+# Share of the detection region a colour must cover to count as dominant
+MIN_COLOR_FRACTION = 0.03
+
+# Reference colours (BGR) the colour detector can name
+COLOR_REFERENCES = {
+    'red': (0, 0, 255),
+    'blue': (255, 0, 0),
+    'green': (0, 255, 0),
+    'yellow': (0, 255, 255),
+    'purple': (128, 0, 128)
+}
+
+# Degrees a pixel's Lab hue may stray from its reference colour - anything
+# further from every reference (skin, orange, brown, cyan) is no colour
+COLOR_HUE_TOLERANCE = {
+    'red': 12,
+    'blue': 25,
+    'green': 25,
+    'yellow': 20,
+    'purple': 25
+}
+
+# Pixels with less Lab chroma than this are too grey to count as any colour
+# (about the saturation 50 cutoff the HSV ranges used)
+MIN_COLOR_CHROMA = 20
+
+# Regions are shrunk to at most this size before colour classification
+COLOR_SAMPLE_SIZE = (64, 64)
+
+# Optional MediaPipe Tasks hand model - when it is installed, hand tracking
+# runs on the GPU if one is available
+HAND_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               '..', '..', 'models', 'hand_landmarker.task')
+
+# Seconds the capture thread keeps running a detector after its results were last asked for
+DETECTION_DEMAND_TIMEOUT = 1.0
 
 class CameraManager:
     def __init__(self):
@@ -12,6 +61,33 @@ class CameraManager:
         self.frame = None
         self.processed_frame = None
         
+        # Actual frame size - the driver may not honour the requested resolution
+        self.frame_width = CAPTURE_WIDTH
+        self.frame_height = CAPTURE_HEIGHT
+        
+        # Display surface, RGB copy and analysis frame built from the current
+        # frame, reused until the next capture
+        self._display_surface = None
+        self._rgb_frame = None
+        self._analysis_frame = None
+        
+        # Background capture - the newest raw frame waits here for the game loop
+        self._latest_frame = None
+        self._frame_lock = threading.Lock()
+        self._capture_thread = None
+        self._capturing = False
+        
+        # Detection results published by the capture thread while a game asks for them
+        self._results = {'faces': [], 'hands': [], 'color': None}
+        self._requested_at = {'faces': 0.0, 'hands': 0.0, 'color': 0.0}
+        
+        # Pixel sample and detector set of the last detection pass
+        self._last_pass = None
+        
+        # Colour label for every (a*, b*) byte pair, so classifying is a lookup
+        self._color_names = list(COLOR_REFERENCES)
+        self._color_labels = self._build_color_labels()
+        
         # Initialize MediaPipe
         self.mp_face_detection = mp.solutions.face_detection
         self.mp_hands = mp.solutions.hands
@@ -19,63 +95,200 @@ class CameraManager:
         
         self.face_detection = None
         self.hands = None
+        self.hand_landmarker = None
+        self._hand_timestamp = 0
         
     def initialize(self):
         """Initialize camera and MediaPipe"""
         try:
             # Try to open camera
-            self.cap = cv2.VideoCapture(0)
-            if not self.cap.isOpened():
+            self.cap = self._open_capture()
+            if self.cap is None:
                 return False
             
             # Set camera properties for better performance
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            # MJPG decodes faster than the default YUYV on most USB webcams
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAPTURE_WIDTH)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAPTURE_HEIGHT)
             self.cap.set(cv2.CAP_PROP_FPS, 30)
             
+            # Keep at most one frame queued in the driver so reads are never stale
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            
             # Initialize MediaPipe
             self.face_detection = self.mp_face_detection.FaceDetection(
                 model_selection=0, min_detection_confidence=0.5
             )
-            self.hands = self.mp_hands.Hands(
-                static_image_mode=False,
-                max_num_hands=2,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
+            
+            # Prefer the GPU hand landmarker, falling back to the CPU solution
+            self.hand_landmarker = self._create_gpu_hand_landmarker()
+            if self.hand_landmarker is None:
+                self.hands = self.mp_hands.Hands(
+                    static_image_mode=False,
+                    max_num_hands=2,
+                    min_detection_confidence=0.5,
+                    min_tracking_confidence=0.5
+                )
+            
+            # Read frames in the background so the game loop never waits on the camera
+            self._capturing = True
+            self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self._capture_thread.start()
             
             return True
         except Exception as e:
             print(f"Camera initialization error: {e}")
             return False
     
+    def _create_gpu_hand_landmarker(self):
+        """Create a GPU hand landmarker, or None if the model or a GPU is missing"""
+        if not os.path.exists(HAND_MODEL_PATH):
+            return None
+        
+        try:
+            from mediapipe.tasks.python import BaseOptions, vision
+            options = vision.HandLandmarkerOptions(
+                base_options=BaseOptions(model_asset_path=HAND_MODEL_PATH,
+                                         delegate=BaseOptions.Delegate.GPU),
+                running_mode=vision.RunningMode.VIDEO,
+                num_hands=2,
+                min_hand_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
+            landmarker = vision.HandLandmarker.create_from_options(options)
+            print("🚀 Hand tracking running on the GPU")
+            return landmarker
+        except Exception as e:
+            print(f"GPU hand tracking unavailable, using CPU: {e}")
+            return None
+    
+    def _open_capture(self):
+        """Open the cached camera with a fast backend, falling back to the defaults"""
+        backend = preferred_backend()
+        cached_index = load_camera_index()
+        
+        candidates = [(0, backend), (0, cv2.CAP_ANY)]
+        if cached_index is not None:
+            candidates.insert(0, (cached_index, backend))
+        
+        for index, api in dict.fromkeys(candidates):
+            cap = cv2.VideoCapture(index, api)
+            if cap.isOpened():
+                return cap
+            cap.release()
+        
+        return None
+    
+    def _capture_loop(self):
+        """Keep reading frames, holding on to only the newest one"""
+        while self._capturing:
+            ret, frame = self.cap.read()
+            if not ret:
+                time.sleep(0.01)
+                continue
+            
+            # Flip frame horizontally for mirror effect
+            frame = cv2.flip(frame, 1)
+            with self._frame_lock:
+                self._latest_frame = frame
+            
+            # Detect here so the game loop only has to read the results
+            self._run_detectors(frame)
+    
+    def _frame_signature(self, frame):
+        """Sample about 64 pixels of a frame to tell repeated captures apart"""
+        h, w = frame.shape[:2]
+        return frame[::max(1, h // 8), ::max(1, w // 8)].tobytes()
+    
+    def _run_detectors(self, frame):
+        """Run the detectors games are currently asking for on a mirrored frame"""
+        now = time.monotonic()
+        wanted = {name for name, requested_at in self._requested_at.items()
+                  if now - requested_at < DETECTION_DEMAND_TIMEOUT}
+        
+        # A duplicate capture would only reproduce the published results
+        detection_pass = (self._frame_signature(frame), frozenset(wanted))
+        if detection_pass == self._last_pass:
+            return
+        self._last_pass = detection_pass
+        
+        if 'color' in wanted:
+            self._results['color'] = self._classify_color(self._center_region(frame))
+        
+        if 'faces' in wanted or 'hands' in wanted:
+            # One colour conversion serves both MediaPipe models
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            rgb_frame.flags.writeable = False
+            if 'faces' in wanted:
+                self._results['faces'] = self._find_faces(rgb_frame)
+            if 'hands' in wanted:
+                self._results['hands'] = self._find_hands(rgb_frame)
+    
+    def _latest_result(self, name, idle_value):
+        """Read a result published by the capture thread and keep its detector running"""
+        now = time.monotonic()
+        if now - self._requested_at[name] >= DETECTION_DEMAND_TIMEOUT:
+            # Results from before the last lull in requests are stale
+            self._results[name] = idle_value
+        self._requested_at[name] = now
+        return self._results[name]
+    
+    def poll_latest(self):
+        """Take the newest captured frame, or None if none arrived since the last poll"""
+        with self._frame_lock:
+            frame, self._latest_frame = self._latest_frame, None
+        
+        if frame is None:
+            return None
+        
+        self._store_frame(frame)
+        return self.frame
+    
     def capture_frame(self):
         """Capture a frame from camera"""
         if self.cap is None:
             return False
         
+        if self._capture_thread is not None:
+            return self.poll_latest() is not None
+        
         ret, frame = self.cap.read()
         if ret:
             # Flip frame horizontally for mirror effect
-            self.frame = cv2.flip(frame, 1)
-            self.processed_frame = self.frame.copy()
+            self._store_frame(cv2.flip(frame, 1))
             return True
         return False
     
+    def _store_frame(self, frame):
+        """Make a mirrored camera frame the current one"""
+        self.frame = frame
+        self.frame_height, self.frame_width = self.frame.shape[:2]
+        # Nothing draws on the processed frame, so it can share the captured one
+        self.processed_frame = self.frame
+        self._display_surface = None
+        self._rgb_frame = None
+        self._analysis_frame = None
+    
     def detect_faces(self):
         """Detect faces in current frame"""
         if self.frame is None:
             return []
         
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(self.frame, cv2.COLOR_BGR2RGB)
+        if self._capture_thread is not None:
+            return self._latest_result('faces', [])
+        
+        return self._find_faces(self._get_rgb_frame())
+    
+    def _find_faces(self, rgb_frame):
+        """Run face detection on an RGB frame"""
         results = self.face_detection.process(rgb_frame)
         
         faces = []
         if results.detections:
             for detection in results.detections:
                 bbox = detection.location_data.relative_bounding_box
-                h, w, _ = self.frame.shape
+                h, w, _ = rgb_frame.shape
                 
                 # Convert relative coordinates to absolute
                 x = int(bbox.xmin * w)
@@ -95,29 +308,37 @@ class CameraManager:
         if self.frame is None:
             return []
         
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(self.frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        if self._capture_thread is not None:
+            return self._latest_result('hands', [])
+        
+        return self._find_hands(self._get_rgb_frame())
+    
+    def _find_hands(self, rgb_frame):
+        """Run hand tracking on an RGB frame"""
+        if self.hand_landmarker is not None:
+            # Video mode needs strictly increasing timestamps
+            self._hand_timestamp = max(self._hand_timestamp + 1, int(time.monotonic() * 1000))
+            image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+            all_landmarks = self.hand_landmarker.detect_for_video(image, self._hand_timestamp).hand_landmarks
+        else:
+            results = self.hands.process(rgb_frame)
+            all_landmarks = [hand_landmarks.landmark for hand_landmarks in results.multi_hand_landmarks or []]
         
         hands = []
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                # Get hand center point
-                h, w, _ = self.frame.shape
-                landmarks = []
-                
-                for landmark in hand_landmarks.landmark:
-                    x = int(landmark.x * w)
-                    y = int(landmark.y * h)
-                    landmarks.append((x, y))
-                
-                # Calculate center of hand
-                center_x = sum(point[0] for point in landmarks) // len(landmarks)
-                center_y = sum(point[1] for point in landmarks) // len(landmarks)
-                
+        if all_landmarks:
+            # Landmark pixel positions of every hand as one (hands, 21, 2) array
+            h, w, _ = rgb_frame.shape
+            points = np.array([[(landmark.x, landmark.y) for landmark in landmarks]
+                               for landmarks in all_landmarks])
+            points = (points * (w, h)).astype(np.int64)
+            
+            # Calculate center of each hand
+            centers = points.sum(axis=1) // points.shape[1]
+            
+            for landmarks, (center_x, center_y) in zip(points.tolist(), centers.tolist()):
                 hands.append({
                     'center': (center_x, center_y),
-                    'landmarks': landmarks
+                    'landmarks': [tuple(point) for point in landmarks]
                 })
         
         return hands
@@ -127,60 +348,128 @@ class CameraManager:
         if self.frame is None:
             return None
         
+        if region is None and self._capture_thread is not None:
+            return self._latest_result('color', None)
+        
         # Use center region if no region specified
         if region is None:
-            h, w = self.frame.shape[:2]
-            region = self.frame[h//3:2*h//3, w//3:2*w//3]
-        
-        # Convert to HSV for better color detection
-        hsv = cv2.cvtColor(region, cv2.COLOR_BGR2HSV)
-        
-        # Define color ranges in HSV
-        color_ranges = {
-            'red': [(0, 50, 50), (10, 255, 255)],
-            'red2': [(170, 50, 50), (180, 255, 255)],  # Red wraps around
-            'blue': [(100, 50, 50), (130, 255, 255)],
-            'green': [(40, 50, 50), (80, 255, 255)],
-            'yellow': [(20, 50, 50), (40, 255, 255)],
-            'purple': [(130, 50, 50), (170, 255, 255)]
-        }
-        
-        max_pixels = 0
-        dominant_color = None
-        
-        for color, (lower, upper) in color_ranges.items():
-            if color == 'red2':
-                continue  # Handle red separately
-            
-            mask = cv2.inRange(hsv, np.array(lower), np.array(upper))
-            
-            # Special handling for red (it wraps around in HSV)
-            if color == 'red':
-                mask2 = cv2.inRange(hsv, np.array(color_ranges['red2'][0]), 
-                                  np.array(color_ranges['red2'][1]))
-                mask = cv2.bitwise_or(mask, mask2)
-            
-            pixel_count = cv2.countNonZero(mask)
-            
-            if pixel_count > max_pixels and pixel_count > 1000:  # Minimum threshold
-                max_pixels = pixel_count
-                dominant_color = color
+            region = self._center_region(self.frame)
         
-        return dominant_color
+        return self._classify_color(region)
+    
+    def _center_region(self, frame):
+        """Middle third of a frame, where players hold up colours"""
+        h, w = frame.shape[:2]
+        return frame[h//3:2*h//3, w//3:2*w//3]
+    
+    def _classify_color(self, region):
+        """Name the colour covering the most of a BGR region, or None"""
+        # Colour coverage survives downscaling, so classify a small fixed-size sample
+        # (the coverage threshold is a fraction, so it scales along)
+        h, w = region.shape[:2]
+        sample_size = (min(w, COLOR_SAMPLE_SIZE[0]), min(h, COLOR_SAMPLE_SIZE[1]))
+        if sample_size != (w, h):
+            region = cv2.resize(region, sample_size, interpolation=cv2.INTER_AREA)
+        
+        # Label every pixel by its Lab chroma and count the votes in one pass;
+        # the extra last bin collects the greys and is dropped
+        lab = cv2.cvtColor(region, cv2.COLOR_BGR2LAB)
+        votes = self._color_labels[lab[:, :, 1], lab[:, :, 2]]
+        counts = np.bincount(votes.ravel(), minlength=len(self._color_names) + 1)[:-1]
+        
+        best = int(counts.argmax())
+        min_pixels = region.shape[0] * region.shape[1] * MIN_COLOR_FRACTION
+        if counts[best] > min_pixels:
+            return self._color_names[best]
+        return None
+    
+    def _build_color_labels(self):
+        """Label every (a*, b*) byte pair once, so classifying a pixel is a table lookup"""
+        # OpenCV offsets a* and b* by 128
+        axis = np.arange(256, dtype=np.float32) - 128
+        ab = np.stack(np.meshgrid(axis, axis, indexing='ij'), axis=2).reshape(-1, 2)
+        return self._hue_labels(ab).astype(np.uint8).reshape(256, 256)
+    
+    def _hue_labels(self, ab):
+        """Label (a*, b*) points with the reference hue closest in angle, if close enough"""
+        # Hue direction of each reference colour in the Lab a*b* plane
+        references = np.array([list(COLOR_REFERENCES.values())], dtype=np.uint8)
+        reference_ab = cv2.cvtColor(references, cv2.COLOR_BGR2LAB)[0, :, 1:].astype(np.float32) - 128
+        directions = reference_ab / np.linalg.norm(reference_ab, axis=1, keepdims=True)
+        
+        projections = ab @ directions.T
+        labels = projections.argmax(axis=1)
+        
+        # Hues too far from their nearest reference and greys, which carry no
+        # hue, get a label past the last colour
+        chroma = np.linalg.norm(ab, axis=1)
+        min_cosine = np.cos(np.radians([COLOR_HUE_TOLERANCE[name] for name in COLOR_REFERENCES]))
+        off_hue = projections[np.arange(len(ab)), labels] < chroma * min_cosine[labels]
+        labels[off_hue | (chroma < MIN_COLOR_CHROMA)] = len(directions)
+        return labels
     
     def get_frame_for_display(self):
         """Get frame ready for display (converted to RGB)"""
         if self.processed_frame is None:
             return None
         
-        # Convert BGR to RGB for pygame
-        return cv2.cvtColor(self.processed_frame, cv2.COLOR_BGR2RGB)
+        return self._get_rgb_frame()
+    
+    def _get_rgb_frame(self):
+        """Get the current frame converted to RGB, shared by detectors and display"""
+        if self._rgb_frame is None:
+            self._rgb_frame = cv2.cvtColor(self.frame, cv2.COLOR_BGR2RGB)
+            # Read-only lets MediaPipe use the buffer without copying it
+            self._rgb_frame.flags.writeable = False
+        
+        return self._rgb_frame
+    
+    def get_frame_for_analysis(self):
+        """Get a small grayscale copy of the current frame for CV work"""
+        if self.frame is None:
+            return None
+        
+        if self._analysis_frame is None:
+            # Shrink first so the colour conversion touches fewer pixels
+            small = cv2.resize(self.frame, ANALYSIS_SIZE, interpolation=cv2.INTER_AREA)
+            self._analysis_frame = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        
+        return self._analysis_frame
+    
+    def get_display_surface(self, size):
+        """Get the current frame as a pygame Surface scaled to size"""
+        if self._display_surface is not None and self._display_surface.get_size() == size:
+            return self._display_surface
+        
+        if self.frame is None:
+            return None
+        
+        # Wrap the BGR frame without a colour conversion - convert() below makes the only copy
+        frame = np.ascontiguousarray(self.frame)
+        height, width = frame.shape[:2]
+        surface = pygame.image.frombuffer(frame, (width, height), 'BGR')
+        if (width, height) != tuple(size):
+            surface = pygame.transform.scale(surface, size)
+        
+        self._display_surface = surface.convert()
+        return self._display_surface
     
     def cleanup(self):
         """Clean up camera resources"""
+        if self._capture_thread is not None:
+            self._capturing = False
+            self._capture_thread.join(timeout=1.0)
+            if self._capture_thread.is_alive():
+                # Still inside a read or a detector - freeing the camera and models
+                # under it could crash, so leave them to the daemon thread's exit
+                print("⚠️ Camera thread did not stop, skipping camera cleanup")
+                return
+            self._capture_thread = None
         if self.cap:
             self.cap.release()
         if self.face_detection:
             self.face_detection.close()
         if self.hands:
             self.hands.close()
+        if self.hand_landmarker:
+            self.hand_landmarker.close()
@@ -0,0 +1,38 @@
+"""
+Camera Cache - Remembers which camera worked so startup can skip probing
+"""
+
+import json
+import os
+import platform
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".kidcamgame_cache.json")
+
+def preferred_backend():
+    """Get the capture backend that opens fastest on this platform"""
+    import cv2
+    
+    system = platform.system()
+    if system == "Windows":
+        return cv2.CAP_DSHOW
+    if system == "Linux":
+        return cv2.CAP_V4L2
+    if system == "Darwin":
+        return cv2.CAP_AVFOUNDATION
+    return cv2.CAP_ANY
+
+def load_camera_index():
+    """Get the cached camera index, or None if nothing was cached"""
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as fh:
+            return int(json.load(fh)["camera_index"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_camera_index(index):
+    """Remember the camera index that opened successfully"""
+    try:
+        with open(CACHE_PATH, "w", encoding="utf-8") as fh:
+            json.dump({"camera_index": index}, fh)
+    except OSError as e:
+        print(f"Could not save camera cache: {e}")